@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
-Resume Scanner Backend - Development Server
-For production, use: uvicorn src.infrastructure.web.fastapi_app:app
+Resume Scanner Backend - Server
+Set DEBUG=1 for a single auto-reloading development process.
 """
 
 import os
@@ -13,7 +13,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Import the FastAPI app
 try:
-    from src.adapters.fastapi_app import app
+    from src.adapters.fastapi_app import app, web_concurrency
     print("✅ FastAPI app imported successfully")
 except ImportError as e:
     print(f"❌ Failed to import FastAPI app: {e}")
@@ -28,11 +28,27 @@ if __name__ == "__main__":
     print("❤️  Health Check: http://localhost:8000/health")
     print()
     
-    # Run with uvicorn
-    uvicorn.run(
-        "src.adapters.fastapi_app:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info"
-    )
\ No newline at end of file
+    # Run with uvicorn: auto-reload in debug, otherwise one worker per core
+    # (x2 + 1, overridable via WEB_CONCURRENCY) on uvloop and httptools.
+    # WEB_CONCURRENCY is exported so each worker sizes its parse pool to match.
+    if os.getenv("DEBUG", "").lower() in ("1", "true", "yes"):
+        os.environ["WEB_CONCURRENCY"] = "1"
+        uvicorn.run(
+            "src.adapters.fastapi_app:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True,
+            log_level="info"
+        )
+    else:
+        workers = web_concurrency()
+        os.environ["WEB_CONCURRENCY"] = str(workers)
+        uvicorn.run(
+            "src.adapters.fastapi_app:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=workers,
+            loop="uvloop",
+            http="httptools",
+            log_level="info"
+        )
\ No newline at end of file
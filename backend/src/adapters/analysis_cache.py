@@ -0,0 +1,187 @@
+"""
+Infrastructure Adapters - AI Analysis Response Cache
+"""
+
+import asyncio
+import copy
+import time
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import numpy as np
+from src.domain.resume import AnalysisMode
+
+
+def _digest(text: str) -> str:
+    """Short stable digest of a text, used in cache keys"""
+    return blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# (expires_at, scope, result, unit embedding or None)
+_Entry = Tuple[float, str, Dict[str, Any], Optional[np.ndarray]]
+
+
+class _ComputationAbandoned(Exception):
+    """Raised to waiters when the caller computing their result is cancelled"""
+
+
+class AnalysisCache:
+    """
+    Bounded in-process cache for AI analysis results
+
+    Exact hits are keyed by BLAKE2b digests of the resume text, analysis mode
+    and job description. When an ``embed`` coroutine is given, exact misses
+    fall back to the cached resume with the most similar embedding (cosine
+    similarity at or above ``similarity_threshold``) for the same mode and job
+    description, so lightly reformatted re-uploads still hit.
+
+    The cache is only an optimisation: embedding failures fall back to
+    ``compute``, callers get their own copy of cached results, and concurrent
+    misses for the same key share a single ``compute`` call.
+    """
+
+    def __init__(self, max_entries: int = 1024,
+                 ttl_seconds: float = 7 * 24 * 3600,
+                 embed: Optional[Callable[[str], Awaitable[List[float]]]] = None,
+                 similarity_threshold: float = 0.97):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self._embed = embed
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        # key -> future of the in-progress computation for that key
+        self._in_flight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups served from the cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    async def get_or_compute(self, resume_text: str, analysis_mode: AnalysisMode,
+                             job_description: Optional[str],
+                             compute: Callable[[], Awaitable[Dict[str, Any]]]
+                             ) -> Dict[str, Any]:
+        """Return the cached analysis for these inputs, computing it on a miss"""
+        scope, key = self._scope_and_key(resume_text, analysis_mode, job_description)
+
+        while True:
+            cached = self._get(key)
+            if cached is not None:
+                self.hits += 1
+                return copy.deepcopy(cached)
+
+            pending = self._in_flight.get(key)
+            if pending is None:
+                break
+            try:
+                stored = await asyncio.shield(pending)
+            except _ComputationAbandoned:
+                continue  # the computing caller was cancelled; look up afresh
+            self.hits += 1
+            return copy.deepcopy(stored)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result, stored = await self._lookup_or_compute(
+                scope, key, resume_text, compute
+            )
+        except Exception as error:
+            future.set_exception(error)
+            future.exception()  # waiters re-raise it; no "never retrieved" warning
+            raise
+        except BaseException:
+            # Cancellation belongs to this caller only: waiters retry instead,
+            # and the first of them computes the result in its place
+            future.set_exception(_ComputationAbandoned())
+            future.exception()
+            raise
+        else:
+            future.set_result(stored)
+            return result
+        finally:
+            del self._in_flight[key]
+
+    def get(self, resume_text: str, analysis_mode: AnalysisMode,
+            job_description: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Return a copy of the exact cached analysis for these inputs, if any"""
+        _, key = self._scope_and_key(resume_text, analysis_mode, job_description)
+        cached = self._get(key)
+        if cached is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return copy.deepcopy(cached)
+
+    def put(self, resume_text: str, analysis_mode: AnalysisMode,
+            job_description: Optional[str], result: Dict[str, Any]) -> None:
+        """Cache an analysis computed outside ``get_or_compute``"""
+        scope, key = self._scope_and_key(resume_text, analysis_mode, job_description)
+        self._store(key, scope, copy.deepcopy(result), None)
+
+    async def _lookup_or_compute(self, scope: str, key: str, resume_text: str,
+                                 compute: Callable[[], Awaitable[Dict[str, Any]]]
+                                 ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Serve an exact miss semantically or compute it; returns (result, stored)"""
+        vector = None
+        if self._embed is not None:
+            try:
+                vector = np.asarray(await self._embed(resume_text), dtype=np.float32)
+            except Exception:
+                vector = None  # embedding is best-effort; analyse without it
+            else:
+                vector /= np.linalg.norm(vector) or 1.0
+                cached = self._nearest(scope, vector)
+                if cached is not None:
+                    self.hits += 1
+                    self.semantic_hits += 1
+                    return copy.deepcopy(cached), cached
+
+        self.misses += 1
+        result = await compute()
+        stored = copy.deepcopy(result)
+        self._store(key, scope, stored, vector)
+        return result, stored
+
+    @staticmethod
+    def _scope_and_key(resume_text: str, analysis_mode: AnalysisMode,
+                       job_description: Optional[str]) -> Tuple[str, str]:
+        """Semantic lookup scope and exact cache key for these inputs"""
+        scope = f"{analysis_mode.value}:{_digest(job_description or '')}"
+        return scope, f"{scope}:{_digest(resume_text)}"
+
+    def _store(self, key: str, scope: str, stored: Dict[str, Any],
+               vector: Optional[np.ndarray]) -> None:
+        """Add an entry, evicting the least recently used beyond max_entries"""
+        expires_at = time.monotonic() + self.ttl_seconds
+        self._entries[key] = (expires_at, scope, stored, vector)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a live entry and mark it recently used, dropping it if expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[2]
+
+    def _nearest(self, scope: str, vector: np.ndarray) -> Optional[Dict[str, Any]]:
+        """Return the most similar live entry in scope above the threshold"""
+        now = time.monotonic()
+        best_key, best_score = None, self.similarity_threshold
+        for key, (expires_at, entry_scope, _, entry_vector) in self._entries.items():
+            if entry_scope != scope or entry_vector is None or expires_at < now:
+                continue
+            score = float(entry_vector @ vector)
+            if score >= best_score:
+                best_key, best_score = key, score
+        return self._get(best_key) if best_key is not None else None
@@ -2,9 +2,11 @@
 Infrastructure Repositories - Data Persistence Implementation
 """
 
-from typing import Dict, List, Optional
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import DefaultDict, Dict, List, Optional, Tuple
 from src.ports.resume_analysis_port import AnalysisRepositoryPort
-from src.domain.resume import AnalysisResult
+from src.domain.resume import AnalysisResult, AnalysisMode
 
 
 class InMemoryAnalysisRepository(AnalysisRepositoryPort):
@@ -12,17 +14,19 @@ class InMemoryAnalysisRepository(AnalysisRepositoryPort):
     
     def __init__(self):
         self._analyses: Dict[str, AnalysisResult] = {}
-        self._resume_analyses: Dict[str, List[str]] = {}  # resume_id -> analysis_ids
+        self._resume_analyses: DefaultDict[str, List[str]] = defaultdict(list)  # resume_id -> analysis_ids
+        self._latest_by_content: Dict[Tuple[str, AnalysisMode], str] = {}  # (content_hash, mode) -> analysis_id
     
     def save_analysis(self, analysis: AnalysisResult) -> str:
         """Save analysis result and return ID"""
         self._analyses[analysis.id] = analysis
         
         # Track analyses by resume
-        if analysis.resume_id not in self._resume_analyses:
-            self._resume_analyses[analysis.resume_id] = []
         self._resume_analyses[analysis.resume_id].append(analysis.id)
         
+        if analysis.content_hash:
+            self._latest_by_content[(analysis.content_hash, analysis.mode)] = analysis.id
+        
         return analysis.id
     
     def get_analysis(self, analysis_id: str) -> Optional[AnalysisResult]:
@@ -31,8 +35,20 @@ class InMemoryAnalysisRepository(AnalysisRepositoryPort):
     
     def get_analyses_by_resume(self, resume_id: str) -> List[AnalysisResult]:
         """Get all analyses for a resume"""
-        analysis_ids = self._resume_analyses.get(resume_id, [])
-        return [self._analyses[aid] for aid in analysis_ids if aid in self._analyses]
+        # Every indexed ID was saved alongside its analysis, so no membership check
+        return [self._analyses[aid] for aid in self._resume_analyses.get(resume_id, ())]
+    
+    def find_recent(self, content_hash: str, mode: AnalysisMode,
+                    max_age: timedelta) -> Optional[AnalysisResult]:
+        """Get the latest analysis of identical resume text, if newer than max_age"""
+        analysis_id = self._latest_by_content.get((content_hash, mode))
+        if analysis_id is None:
+            return None
+        
+        analysis = self._analyses[analysis_id]
+        if datetime.now(tz=analysis.created_at.tzinfo) - analysis.created_at > max_age:
+            return None
+        return analysis
 
 
 class DatabaseAnalysisRepository(AnalysisRepositoryPort):
@@ -75,4 +91,12 @@ class DatabaseAnalysisRepository(AnalysisRepositoryPort):
     def get_analyses_by_resume(self, resume_id: str) -> List[AnalysisResult]:
         """Get all analyses for a resume from database"""
         # In production, implement database query
-        return []
\ No newline at end of file
+        return []
+    
+    def find_recent(self, content_hash: str, mode: AnalysisMode,
+                    max_age: timedelta) -> Optional[AnalysisResult]:
+        """Get the latest recent analysis of identical resume text from database"""
+        # In production, query an index on (content_hash, mode, created_at):
+        # WHERE content_hash = :hash AND mode = :mode AND created_at >= now() - :max_age
+        # ORDER BY created_at DESC LIMIT 1
+        return None
\ No newline at end of file
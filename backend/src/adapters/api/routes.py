@@ -2,77 +2,149 @@
 Infrastructure Web Layer - API Routes
 """
 
-import uuid
+import asyncio
+import functools
+import os
+import secrets
+from concurrent.futures import Executor
 from datetime import datetime
-from fastapi import APIRouter, File, UploadFile, HTTPException
+from typing import Any, BinaryIO, Dict, Optional
+import orjson
+from fastapi import APIRouter, File, UploadFile, HTTPException, Response
 from src.adapters.api.models import AnalysisRequest, AnalysisResponse, UploadResponse
 from src.adapters.mock_resume_analysis_service import MockResumeAnalysisService
-from src.domain.resume import Resume, ContactInfo, ResumeSection, JobDescription
+from src.domain.analysis_criteria import ATSCriteria
+from src.domain.resume import (
+    Resume, ContactInfo, JobDescription, AnalysisResult, content_digest
+)
 
+ALLOWED_EXTENSIONS = ('.pdf', '.docx')
+MAX_UPLOAD_BYTES = ATSCriteria.default().max_file_size_mb * 1024 * 1024
+PREVIEW_CHARS = 500
 
-def create_routes(resume_service: MockResumeAnalysisService, analysis_repo) -> APIRouter:
-    """Create API routes"""
+# Placeholder resume/job data for text-only analysis. Shared and read-only:
+# nothing downstream mutates these, so they are not rebuilt per request.
+DEFAULT_CONTACT_INFO = ContactInfo()
+NO_SECTIONS = ()
+DEFAULT_RESUME_KEYWORDS = ("Python", "FastAPI", "React")
+NO_SKILLS = ()
+DEFAULT_JOB_KEYWORDS = ("GraphQL", "Microservices", "Python", "React")
+
+# Liveness probes hit /health constantly, so its body is serialized once
+HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "Resume Scanner API",
+    "version": "1.0.0"
+})
+
+
+def _to_analysis_response(result: AnalysisResult) -> Dict[str, Any]:
+    """Build the API response body from a domain result.
+
+    The values come from a trusted ``AnalysisResult``, so the body is a plain
+    dict shaped like ``AnalysisResponse`` (declared via ``responses=``), which
+    skips building, validating and dumping a Pydantic model per response.
+    """
+    return {
+        "id": result.id,
+        "mode": result.mode.value,
+        "score": result.score,
+        "score_level": result.score_level.value,
+        "feedback": result.feedback,
+        "recommendations": result.recommendations,
+        "strengths": result.strengths,
+        "weaknesses": result.weaknesses,
+        "missing_keywords": result.missing_keywords,
+        "matched_keywords": result.matched_keywords,
+        "timestamp": result.created_at_iso
+    }
+
+
+def create_routes(resume_service: MockResumeAnalysisService, analysis_repo,
+                  parse_executor: Optional[Executor] = None) -> APIRouter:
+    """Create API routes
+
+    File parsing is CPU-bound, so it runs on ``parse_executor`` (or the
+    loop's default executor) to keep the event loop free for other requests.
+    PDF parses from these threads are serialised per process unless the file
+    parser has a page pool to hand them to; DOCX parses run concurrently.
+    """
     
     router = APIRouter()
     
     @router.get("/health")
     async def health_check():
         """Health check endpoint"""
-        return {
-            "status": "healthy",
-            "service": "Resume Scanner API",
-            "version": "1.0.0"
-        }
+        return Response(content=HEALTH_BODY, media_type="application/json")
+    
+    def read_and_process_resume(upload: BinaryIO, file_name: str) -> Resume:
+        """Read a spooled upload synchronously and process it"""
+        # Already buffered by the multipart parser: one bounded read, no async hops
+        file_bytes = upload.read(MAX_UPLOAD_BYTES + 1)
+        if len(file_bytes) > MAX_UPLOAD_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail="File size exceeds 5MB limit"
+            )
+        return resume_service.process_resume_file(file_bytes, file_name)
     
     @router.post("/api/upload", response_model=UploadResponse)
     async def upload_resume(file: UploadFile = File(...)):
         """Upload and process resume file"""
         try:
             # Validate file type
-            if not file.filename.lower().endswith(('.pdf', '.docx')):
+            extension = os.path.splitext(file.filename or "")[1].lower()
+            if extension not in ALLOWED_EXTENSIONS:
                 raise HTTPException(
                     status_code=400, 
                     detail="Only PDF and DOCX files are supported"
                 )
             
-            # Read file content
-            file_content = await file.read()
-            
-            # Validate file size (5MB limit)
-            if len(file_content) > 5 * 1024 * 1024:
+            # Reject oversized uploads before reading them
+            if file.size is not None and file.size > MAX_UPLOAD_BYTES:
                 raise HTTPException(
-                    status_code=400,
+                    status_code=413,
                     detail="File size exceeds 5MB limit"
                 )
             
-            # Process resume
-            resume = resume_service.process_resume_file(file_content, file.filename)
+            # Read and process resume off the event loop
+            loop = asyncio.get_running_loop()
+            resume = await loop.run_in_executor(
+                parse_executor,
+                read_and_process_resume,
+                file.file,
+                file.filename
+            )
             
+            raw_text = resume.raw_text
             return UploadResponse(
                 success=True,
                 message="Resume uploaded and processed successfully",
                 resume_id=resume.id,
-                extracted_text=resume.raw_text[:500] + "..." if len(resume.raw_text) > 500 else resume.raw_text
+                extracted_text=f"{raw_text[:PREVIEW_CHARS]}..." if len(raw_text) > PREVIEW_CHARS else raw_text
             )
             
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
     
-    @router.post("/api/analyze", response_model=AnalysisResponse)
+    @router.post("/api/analyze", responses={200: {"model": AnalysisResponse}})
     async def analyze_resume(request: AnalysisRequest):
         """Analyze resume for ATS compatibility or job matching"""
         try:
             resume = Resume(
-                id=str(uuid.uuid4()),
+                id=secrets.token_hex(16),
                 raw_text=request.resume_text,
-                contact_info=ContactInfo(),
-                sections=[],
-                keywords=["Python", "FastAPI", "React"],
-                created_at=datetime.now()
+                contact_info=DEFAULT_CONTACT_INFO,
+                sections=NO_SECTIONS,
+                keywords=DEFAULT_RESUME_KEYWORDS,
+                created_at=datetime.now(),
+                content_hash=content_digest(request.resume_text)
             )
             
             if request.mode == "ats":
-                result = resume_service.analyze_ats_compatibility(resume)
+                result = await resume_service.analyze_ats_compatibility(resume)
             elif request.mode == "job_match":
                 if not request.job_description:
                     raise HTTPException(
@@ -81,58 +153,43 @@ def create_routes(resume_service: MockResumeAnalysisService, analysis_repo) -> A
                     )
                 
                 job_desc = JobDescription(
-                    id=str(uuid.uuid4()),
+                    id=secrets.token_hex(16),
                     raw_text=request.job_description,
-                    required_skills=[],
-                    preferred_skills=[],
-                    keywords=["GraphQL", "Microservices", "Python", "React"]
+                    required_skills=NO_SKILLS,
+                    preferred_skills=NO_SKILLS,
+                    keywords=DEFAULT_JOB_KEYWORDS
                 )
                 
-                result = resume_service.analyze_job_match(resume, job_desc)
+                result = await resume_service.analyze_job_match(resume, job_desc)
             else:
                 raise HTTPException(
                     status_code=400,
                     detail="Invalid analysis mode. Use 'ats' or 'job_match'"
                 )
             
-            return AnalysisResponse(
-                id=result.id,
-                mode=result.mode.value,
-                score=result.score,
-                score_level=result.score_level.value,
-                feedback=result.feedback,
-                recommendations=result.recommendations,
-                strengths=result.strengths,
-                weaknesses=result.weaknesses,
-                missing_keywords=result.missing_keywords,
-                matched_keywords=result.matched_keywords,
-                timestamp=result.created_at.isoformat()
-            )
+            return _to_analysis_response(result)
             
         except HTTPException:
             raise
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
     
-    @router.get("/api/analysis/{analysis_id}")
-    async def get_analysis(analysis_id: str):
-        """Get analysis result by ID"""
+    @functools.lru_cache(maxsize=1024)
+    def build_analysis_response(analysis_id: str) -> Dict[str, Any]:
+        """Build the response for a saved analysis.
+
+        Saved results never change, so responses are cached by ID. A missing
+        ID raises instead of returning, which keeps 404s out of the cache.
+        """
         analysis = analysis_repo.get_analysis(analysis_id)
         if not analysis:
             raise HTTPException(status_code=404, detail="Analysis not found")
         
-        return AnalysisResponse(
-            id=analysis.id,
-            mode=analysis.mode.value,
-            score=analysis.score,
-            score_level=analysis.score_level.value,
-            feedback=analysis.feedback,
-            recommendations=analysis.recommendations,
-            strengths=analysis.strengths,
-            weaknesses=analysis.weaknesses,
-            missing_keywords=analysis.missing_keywords,
-            matched_keywords=analysis.matched_keywords,
-            timestamp=analysis.created_at.isoformat()
-        )
+        return _to_analysis_response(analysis)
+    
+    @router.get("/api/analysis/{analysis_id}", responses={200: {"model": AnalysisResponse}})
+    async def get_analysis(analysis_id: str):
+        """Get analysis result by ID"""
+        return build_analysis_response(analysis_id)
     
     return router 
\ No newline at end of file
@@ -2,24 +2,68 @@
 Infrastructure Web Layer - FastAPI Application
 """
 
+import multiprocessing
 import os
+from typing import Any
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from src.adapters.api.routes import create_routes
 from src.domain.resume_analysis_service import ResumeAnalysisService
 from src.adapters.mock_resume_analysis_service import MockResumeAnalysisService
-from src.adapters.file_parser_adapter import FileParserAdapter
+from src.adapters.file_parser_adapter import (
+    MAX_PAGE_WORKERS, MIN_PAGE_WORKERS, FileParserAdapter
+)
 from src.adapters.openai_analysis_adapter import OpenAIAnalysisAdapter
 from src.adapters.analysis_repository import InMemoryAnalysisRepository
+import orjson
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON response encoded with orjson instead of the stdlib json module"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+def web_concurrency() -> int:
+    """Number of uvicorn worker processes: WEB_CONCURRENCY, else 2 x cores + 1"""
+    return int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1))
 
 
 def create_fastapi_app() -> FastAPI:
     """Factory function to create FastAPI application"""
     
+    # Worker pools for CPU-bound resume parsing, shut down with the app. Each
+    # uvicorn worker gets its own page pool of cores // WEB_CONCURRENCY
+    # processes, and none below MIN_PAGE_WORKERS. With a page pool, PDFs are
+    # parsed in its processes. Without one (the default 2 x cores + 1 workers)
+    # uploads are parsed on the thread pool: DOCX parses run in parallel, but
+    # the PDF libraries are not thread-safe, so PDF parses in one uvicorn
+    # worker run one at a time and scale with the number of uvicorn workers.
+    # Forkserver children are not forked from this multi-threaded process
+    parse_executor = ThreadPoolExecutor(thread_name_prefix="resume-parser")
+    page_workers = min(MAX_PAGE_WORKERS, (os.cpu_count() or 1) // web_concurrency())
+    page_executor = ProcessPoolExecutor(
+        max_workers=page_workers,
+        mp_context=multiprocessing.get_context("forkserver")
+    ) if page_workers >= MIN_PAGE_WORKERS else None
+    
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        yield
+        parse_executor.shutdown(wait=False, cancel_futures=True)
+        if page_executor is not None:
+            page_executor.shutdown(wait=False, cancel_futures=True)
+    
     app = FastAPI(
         title="Resume Scanner API",
         description="AI-powered resume analysis for ATS compatibility and job matching",
-        version="1.0.0"
+        version="1.0.0",
+        default_response_class=OrjsonResponse,
+        lifespan=lifespan
     )
     
     # CORS middleware
@@ -32,7 +76,7 @@ def create_fastapi_app() -> FastAPI:
     )
     
     
-    file_parser = FileParserAdapter()
+    file_parser = FileParserAdapter(page_executor)
     ai_analyzer = OpenAIAnalysisAdapter(api_key=os.getenv("OPENAI_API_KEY", "my-api-key"))
     analysis_repo = InMemoryAnalysisRepository()
     
@@ -40,7 +84,7 @@ def create_fastapi_app() -> FastAPI:
     # resume_service = ResumeAnalysisService(file_parser, ai_analyzer, analysis_repo)
     
     # Create and include routes
-    routes = create_routes(resume_service, analysis_repo)
+    routes = create_routes(resume_service, analysis_repo, parse_executor)
     app.include_router(routes)
     
     return app
@@ -0,0 +1,28 @@
+"""
+Infrastructure Adapters - Keyword Matching
+"""
+
+from typing import Iterable, List
+import ahocorasick
+
+
+class KeywordMatcher:
+    """Case-insensitive matcher for a fixed keyword dictionary
+
+    Compiles the keywords into one Aho-Corasick automaton, so a text is
+    scanned once however many keywords there are.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = tuple(keywords)
+        self._automaton = ahocorasick.Automaton()
+        for index, keyword in enumerate(self.keywords):
+            self._automaton.add_word(keyword.lower(), index)
+        self._automaton.make_automaton()
+
+    def find(self, text: str) -> List[str]:
+        """Return the keywords occurring in text, in dictionary order"""
+        if not self.keywords:
+            return []
+        found = {index for _, index in self._automaton.iter(text.lower())}
+        return [self.keywords[index] for index in sorted(found)]
@@ -2,11 +2,22 @@
 Infrastructure Web Layer - Mock Resume Analysis Service
 """
 
-import uuid
+import secrets
 from datetime import datetime
 from src.domain.resume import AnalysisResult, AnalysisMode
 from src.domain.resume import Resume, ContactInfo, ResumeSection
 
+# Canned analysis content. Shared tuples, since nothing mutates result lists.
+_ATS_RECOMMENDATIONS = ("Add more keywords", "Improve formatting")
+_ATS_STRENGTHS = ("Good structure", "Clear contact info")
+_ATS_WEAKNESSES = ("Missing certifications",)
+_JOB_MATCH_RECOMMENDATIONS = ("Add GraphQL experience", "Highlight leadership")
+_JOB_MATCH_STRENGTHS = ("Technical skills match", "Relevant experience")
+_JOB_MATCH_WEAKNESSES = ("Missing some keywords",)
+_JOB_MATCH_MISSING_KEYWORDS = ("GraphQL", "Microservices")
+_JOB_MATCH_MATCHED_KEYWORDS = ("Python", "React")
+_NO_KEYWORDS = ()
+
 
 class MockResumeAnalysisService:
     """Mock service for resume analysis operations in WebContainer environment"""
@@ -19,7 +30,7 @@ class MockResumeAnalysisService:
     def process_resume_file(self, file_bytes: bytes, file_name: str):
         """Process uploaded resume file and create Resume entity"""
         return Resume(
-            id=str(uuid.uuid4()),
+            id=secrets.token_hex(16),
             raw_text="Sample resume text",
             contact_info=ContactInfo(email="john@example.com"),
             sections=[ResumeSection(name="experience", content="", is_present=True)],
@@ -29,38 +40,38 @@ class MockResumeAnalysisService:
             file_size=len(file_bytes)
         )
     
-    def analyze_ats_compatibility(self, resume):
+    async def analyze_ats_compatibility(self, resume):
         """Analyze resume for ATS compatibility"""
         return AnalysisResult(
-            id=str(uuid.uuid4()),
+            id=secrets.token_hex(16),
             resume_id=resume.id,
             mode=AnalysisMode.ATS,
             score=8,
             score_level=None,
             feedback="<div>Mock ATS analysis feedback</div>",
-            recommendations=["Add more keywords", "Improve formatting"],
-            strengths=["Good structure", "Clear contact info"],
-            weaknesses=["Missing certifications"],
-            missing_keywords=[],
+            recommendations=_ATS_RECOMMENDATIONS,
+            strengths=_ATS_STRENGTHS,
+            weaknesses=_ATS_WEAKNESSES,
+            missing_keywords=_NO_KEYWORDS,
             matched_keywords=resume.keywords,
             created_at=datetime.now()
         )
     
-    def analyze_job_match(self, resume, job_description):
+    async def analyze_job_match(self, resume, job_description):
         """Analyze resume against job description"""
 
         return AnalysisResult(
-            id=str(uuid.uuid4()),
+            id=secrets.token_hex(16),
             resume_id=resume.id,
             mode=AnalysisMode.JOB_MATCH,
             score=7,
             score_level=None,
             feedback="<div>Mock job match analysis feedback</div>",
-            recommendations=["Add GraphQL experience", "Highlight leadership"],
-            strengths=["Technical skills match", "Relevant experience"],
-            weaknesses=["Missing some keywords"],
-            missing_keywords=["GraphQL", "Microservices"],
-            matched_keywords=["Python", "React"],
+            recommendations=_JOB_MATCH_RECOMMENDATIONS,
+            strengths=_JOB_MATCH_STRENGTHS,
+            weaknesses=_JOB_MATCH_WEAKNESSES,
+            missing_keywords=_JOB_MATCH_MISSING_KEYWORDS,
+            matched_keywords=_JOB_MATCH_MATCHED_KEYWORDS,
             created_at=datetime.now(),
             job_description_id=job_description.id
         ) 
\ No newline at end of file
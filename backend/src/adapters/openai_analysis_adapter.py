@@ -2,43 +2,204 @@
 Infrastructure Adapters - AI Analysis Implementation
 """
 
-import json
-import re
-from typing import List, Optional, Dict, Any
+import asyncio
+from typing import List, Optional, Dict, Any, Tuple
 from src.ports.resume_analysis_port import AIAnalysisPort
+from src.adapters.analysis_cache import AnalysisCache
+from src.adapters.keyword_matcher import KeywordMatcher
 from src.domain.resume import AnalysisMode
 import openai
+import orjson
+
+# Simple keyword list for demonstration
+TECHNICAL_KEYWORDS = (
+    'React', 'TypeScript', 'JavaScript', 'Node.js', 'Python', 'FastAPI',
+    'PostgreSQL', 'MongoDB', 'AWS', 'Docker', 'Kubernetes', 'Git',
+    'HTML5', 'CSS3', 'Tailwind CSS', 'Express.js', 'Redis', 'Webpack',
+    'Jest', 'CI/CD', 'Vue.js', 'microservices', 'full-stack', 'Agile',
+    'Scrum', 'GraphQL', 'REST API', 'DevOps', 'cloud computing'
+)
+
+# Bulk jobs at or above this size go through the Batch API (half price, separate
+# rate limits, results within 24h); smaller ones are analyzed online
+BATCH_API_THRESHOLD = 20
+BATCH_POLL_INTERVAL_SECONDS = 30
+
+# Smaller ATS batches are pre-screened with up to this many numbered resumes
+# per prompt, so the instructions are billed once per group, not per resume
+BULK_PROMPT_BATCH_SIZE = 10
+_BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# Prompt caching needs a model that supports it and a byte-identical prefix,
+# so all fixed instructions live in the system prompts below and the variable
+# resume and job description text is sent last as the user message. OpenAI
+# only caches prefixes of 1024 tokens or more and these prompts are roughly
+# 200-400 tokens, so on their own they get no cache hits; job match requests
+# only hit when the prompt plus a shared job description reaches 1024 tokens
+ANALYSIS_MODEL = "gpt-4o"
+PROMPT_CACHE_USER = "resume-scanner"
+
+ATS_SYSTEM_PROMPT = """You are an expert resume analyzer.
+
+Analyze the resume in the user message for ATS (Applicant Tracking System) compatibility and provide a comprehensive evaluation.
+
+Please provide analysis in the following JSON format:
+{
+    "score": <1-10 integer>,
+    "strengths": [<list of strengths>],
+    "weaknesses": [<list of areas for improvement>],
+    "recommendations": [<list of specific recommendations>],
+    "ats_compatibility": {
+        "format_score": <1-10>,
+        "keyword_density": <1-10>,
+        "section_structure": <1-10>,
+        "readability": <1-10>
+    }
+}
+
+Focus on:
+1. Resume structure and formatting
+2. Section organization and completeness
+3. Keyword usage and density
+4. ATS-friendly formatting practices
+5. Contact information completeness
+6. Professional summary effectiveness
+"""
+
+JOB_MATCH_SYSTEM_PROMPT = """You are an expert resume analyzer.
+
+Analyze how well the resume in the user message matches the given job description and provide detailed feedback.
+
+Please provide analysis in the following JSON format:
+{
+    "score": <1-10 integer>,
+    "strengths": [<list of matching strengths>],
+    "weaknesses": [<list of gaps or missing elements>],
+    "recommendations": [<list of specific improvements>],
+    "keyword_analysis": {
+        "matched_keywords": [<list of matched keywords>],
+        "missing_keywords": [<list of missing important keywords>],
+        "match_percentage": <percentage as integer>
+    }
+}
+
+Focus on:
+1. Technical skills alignment
+2. Experience level match
+3. Industry-specific requirements
+4. Keyword matching
+5. Qualifications and certifications
+6. Soft skills and cultural fit indicators
+"""
+
+BULK_ATS_SYSTEM_PROMPT = """You are an expert resume analyzer.
+
+Analyze each of the numbered resumes in the user message for ATS (Applicant Tracking System) compatibility and provide a comprehensive evaluation.
+
+Please provide analysis in the following JSON format, with one entry per resume:
+{
+    "results": [
+        {
+            "index": <resume number>,
+            "score": <1-10 integer>,
+            "strengths": [<list of strengths>],
+            "weaknesses": [<list of areas for improvement>],
+            "recommendations": [<list of specific recommendations>],
+            "ats_compatibility": {
+                "format_score": <1-10>,
+                "keyword_density": <1-10>,
+                "section_structure": <1-10>,
+                "readability": <1-10>
+            }
+        }
+    ]
+}
+
+Evaluate every resume on its own. Focus on:
+1. Resume structure and formatting
+2. Section organization and completeness
+3. Keyword usage and density
+4. ATS-friendly formatting practices
+5. Contact information completeness
+6. Professional summary effectiveness
+"""
+
+COMBINED_SYSTEM_PROMPT = """You are an expert resume analyzer.
+
+Analyze the resume in the user message for ATS (Applicant Tracking System) compatibility and for how well it matches the given job description.
+
+Please provide analysis in the following JSON format:
+{
+    "ats": {
+        "score": <1-10 integer>,
+        "strengths": [<list of strengths>],
+        "weaknesses": [<list of areas for improvement>],
+        "recommendations": [<list of specific recommendations>],
+        "ats_compatibility": {
+            "format_score": <1-10>,
+            "keyword_density": <1-10>,
+            "section_structure": <1-10>,
+            "readability": <1-10>
+        }
+    },
+    "job_match": {
+        "score": <1-10 integer>,
+        "strengths": [<list of matching strengths>],
+        "weaknesses": [<list of gaps or missing elements>],
+        "recommendations": [<list of specific improvements>],
+        "keyword_analysis": {
+            "matched_keywords": [<list of matched keywords>],
+            "missing_keywords": [<list of missing important keywords>],
+            "match_percentage": <percentage as integer>
+        }
+    }
+}
+
+For "ats", focus on resume structure and formatting, section organization
+and completeness, keyword usage and density, ATS-friendly formatting,
+contact information and professional summary effectiveness.
+
+For "job_match", focus on technical skills alignment, experience level match,
+industry-specific requirements, keyword matching, qualifications and
+certifications, and soft skills and cultural fit indicators.
+"""
 
 
 class OpenAIAnalysisAdapter(AIAnalysisPort):
     """Adapter for AI-powered analysis using OpenAI"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, max_concurrency: int = 8,
+                 cache_size: int = 1024, semantic_cache: bool = False):
         self.api_key = api_key
-        self.client = openai.OpenAI(api_key=api_key)
+        self.client = openai.AsyncOpenAI(api_key=api_key)
+        # Caps in-flight requests so gathered analyses stay within rate limits
+        self._request_slots = asyncio.Semaphore(max_concurrency)
+        self._keyword_matcher = KeywordMatcher(TECHNICAL_KEYWORDS)
+        # Re-uploads and shared job descriptions reuse earlier analyses
+        self.cache = AnalysisCache(
+            max_entries=cache_size,
+            embed=self._embed if semantic_cache else None
+        )
     
-    def analyze_resume_content(self, resume_text: str, analysis_mode: AnalysisMode, 
-                             job_description: Optional[str] = None) -> Dict[str, Any]:
+    async def analyze_resume_content(self, resume_text: str, analysis_mode: AnalysisMode, 
+                                   job_description: Optional[str] = None) -> Dict[str, Any]:
         """
         Analyze resume content using AI
+
+        Awaits the API without blocking the event loop, so several analyses
+        can be dispatched together with ``asyncio.gather``. Results are cached
+        by resume, mode and job description.
         """
         
-        if analysis_mode == AnalysisMode.ATS:
-            prompt = self._get_ats_analysis_prompt(resume_text)
-        else:
-            prompt = self._get_job_match_prompt(resume_text, job_description)
+        async def request_analysis() -> Dict[str, Any]:
+            return await self._complete(
+                *self._get_prompt(resume_text, analysis_mode, job_description)
+            )
         
-        response = self.client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": "You are an expert resume analyzer..."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.3
+        return await self.cache.get_or_compute(
+            resume_text, analysis_mode, job_description, request_analysis
         )
         
-        return json.loads(response.choices[0].message.content)
-        
         """
         # Mock implementation for demonstration
         if analysis_mode == AnalysisMode.ATS:
@@ -47,6 +208,110 @@ class OpenAIAnalysisAdapter(AIAnalysisPort):
             return self._mock_job_match_analysis(resume_text, job_description or "")
         """
     
+    async def analyze_resume_content_combined(self, resume_text: str,
+                                            job_description: str) -> Dict[str, Any]:
+        """
+        Analyze ATS compatibility and job match with a single completion
+
+        Halves round-trips and resume input tokens compared to two calls.
+        """
+        return await self._complete(
+            COMBINED_SYSTEM_PROMPT,
+            self._get_combined_prompt(resume_text, job_description)
+        )
+    
+    async def analyze_resume_content_batch(self, resume_texts: Dict[str, str],
+                                         analysis_mode: AnalysisMode,
+                                         job_description: Optional[str] = None
+                                         ) -> Dict[str, Dict[str, Any]]:
+        """
+        Analyze many resumes, routing large jobs through the OpenAI Batch API
+
+        Smaller ATS jobs are pre-screened several resumes per prompt. Results
+        are keyed by the IDs in ``resume_texts``; resumes whose batch request
+        failed, or that a bulk reply left out, are left out.
+        """
+        if len(resume_texts) < BATCH_API_THRESHOLD:
+            if analysis_mode == AnalysisMode.ATS:
+                return await self._analyze_ats_bulk_cached(resume_texts)
+            return await super().analyze_resume_content_batch(
+                resume_texts, analysis_mode, job_description
+            )
+        
+        batch_id = await self.submit_batch(resume_texts, analysis_mode, job_description)
+        batch = await self.poll_batch(batch_id)
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch_id} ended with status {batch.status}")
+        return await self.fetch_results(batch.output_file_id)
+    
+    async def analyze_resumes_bulk(self, resume_texts: List[str],
+                                   batch_size: int = BULK_PROMPT_BATCH_SIZE
+                                   ) -> List[Optional[Dict[str, Any]]]:
+        """
+        ATS pre-screen many resumes, several per prompt
+
+        The instructions are sent once per group of ``batch_size`` resumes
+        instead of once per resume. Results are aligned with ``resume_texts``;
+        resumes the model left out of its reply are None.
+        """
+        groups = [
+            resume_texts[start:start + batch_size]
+            for start in range(0, len(resume_texts), batch_size)
+        ]
+        group_results = await asyncio.gather(
+            *(self._analyze_resume_group(group) for group in groups)
+        )
+        return [result for results in group_results for result in results]
+    
+    async def submit_batch(self, resume_texts: Dict[str, str], analysis_mode: AnalysisMode,
+                           job_description: Optional[str] = None) -> str:
+        """Upload one chat request per resume as a JSONL batch and return its ID"""
+        lines = [
+            orjson.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._chat_request(
+                    *self._get_prompt(resume_text, analysis_mode, job_description)
+                )
+            })
+            for custom_id, resume_text in resume_texts.items()
+        ]
+        batch_file = await self.client.files.create(
+            file=("resume_analysis_batch.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+    
+    async def poll_batch(self, batch_id: str,
+                         poll_interval: float = BATCH_POLL_INTERVAL_SECONDS) -> Any:
+        """Wait until a batch reaches a terminal status and return it"""
+        while True:
+            batch = await self.client.batches.retrieve(batch_id)
+            if batch.status in _BATCH_TERMINAL_STATUSES:
+                return batch
+            await asyncio.sleep(poll_interval)
+    
+    async def fetch_results(self, output_file_id: str) -> Dict[str, Dict[str, Any]]:
+        """Download a batch output file and parse each analysis by custom ID"""
+        content = await self.client.files.content(output_file_id)
+        results = {}
+        for line in content.content.splitlines():
+            if not line:
+                continue
+            record = orjson.loads(line)
+            response = record.get("response")
+            if not response or response.get("status_code") != 200:
+                continue
+            message = response["body"]["choices"][0]["message"]["content"]
+            results[record["custom_id"]] = orjson.loads(message)
+        return results
+    
     def extract_keywords(self, text: str) -> List[str]:
         """
         Extract keywords from text
@@ -57,23 +322,7 @@ class OpenAIAnalysisAdapter(AIAnalysisPort):
         - Custom domain-specific keyword lists
         """
         
-        # Simple keyword extraction for demonstration
-        technical_keywords = [
-            'React', 'TypeScript', 'JavaScript', 'Node.js', 'Python', 'FastAPI',
-            'PostgreSQL', 'MongoDB', 'AWS', 'Docker', 'Kubernetes', 'Git',
-            'HTML5', 'CSS3', 'Tailwind CSS', 'Express.js', 'Redis', 'Webpack',
-            'Jest', 'CI/CD', 'Vue.js', 'microservices', 'full-stack', 'Agile',
-            'Scrum', 'GraphQL', 'REST API', 'DevOps', 'cloud computing'
-        ]
-        
-        found_keywords = []
-        text_lower = text.lower()
-        
-        for keyword in technical_keywords:
-            if keyword.lower() in text_lower:
-                found_keywords.append(keyword)
-        
-        return found_keywords
+        return self._keyword_matcher.find(text)
     
     def _mock_ats_analysis(self, resume_text: str) -> Dict[str, Any]:
         """Mock ATS analysis for demonstration"""
@@ -135,66 +384,120 @@ class OpenAIAnalysisAdapter(AIAnalysisPort):
             }
         }
     
-    def _get_ats_analysis_prompt(self, resume_text: str) -> str:
-        """Get prompt for ATS analysis"""
-        return f"""
-        Analyze this resume for ATS (Applicant Tracking System) compatibility and provide a comprehensive evaluation.
-
-        Resume Text:
-        {resume_text}
+    async def _embed(self, text: str) -> List[float]:
+        """Embed text for semantic cache lookups"""
+        async with self._request_slots:
+            response = await self.client.embeddings.create(
+                model="text-embedding-3-small",
+                input=text
+            )
+        return response.data[0].embedding
+    
+    async def _analyze_ats_bulk_cached(self, resume_texts: Dict[str, str]
+                                       ) -> Dict[str, Dict[str, Any]]:
+        """Bulk ATS analysis keyed by ID, answering cached resumes directly"""
+        results = {}
+        pending = {}
+        for resume_id, resume_text in resume_texts.items():
+            cached = self.cache.get(resume_text, AnalysisMode.ATS)
+            if cached is not None:
+                results[resume_id] = cached
+            else:
+                pending[resume_id] = resume_text
+        
+        if len(pending) == 1:
+            analyses = [await self._complete(
+                *self._get_prompt(*pending.values(), AnalysisMode.ATS)
+            )]
+        else:
+            analyses = await self.analyze_resumes_bulk(list(pending.values()))
+        for (resume_id, resume_text), analysis in zip(pending.items(), analyses):
+            if analysis is not None:
+                self.cache.put(resume_text, AnalysisMode.ATS, None, analysis)
+                results[resume_id] = analysis
+        return {
+            resume_id: results[resume_id]
+            for resume_id in resume_texts if resume_id in results
+        }
+    
+    async def _analyze_resume_group(self, resume_texts: List[str]
+                                    ) -> List[Optional[Dict[str, Any]]]:
+        """Analyze one group of resumes, halving it if it overflows the context"""
+        try:
+            reply = await self._complete(
+                BULK_ATS_SYSTEM_PROMPT, self._get_bulk_ats_prompt(resume_texts)
+            )
+        except openai.BadRequestError as e:
+            if e.code != "context_length_exceeded" or len(resume_texts) == 1:
+                raise
+            middle = len(resume_texts) // 2
+            first, second = await asyncio.gather(
+                self._analyze_resume_group(resume_texts[:middle]),
+                self._analyze_resume_group(resume_texts[middle:])
+            )
+            return first + second
+        
+        by_index = {}
+        for result in reply.get("results", []):
+            index = result.pop("index", None)
+            if isinstance(index, int):
+                by_index[index] = result
+        return [by_index.get(index) for index in range(1, len(resume_texts) + 1)]
+    
+    async def _complete(self, system_prompt: str, prompt: str) -> Dict[str, Any]:
+        """
+        Stream a chat completion and parse its JSON reply
 
-        Please provide analysis in the following JSON format:
-        {{
-            "score": <1-10 integer>,
-            "strengths": [<list of strengths>],
-            "weaknesses": [<list of areas for improvement>],
-            "recommendations": [<list of specific recommendations>],
-            "ats_compatibility": {{
-                "format_score": <1-10>,
-                "keyword_density": <1-10>,
-                "section_structure": <1-10>,
-                "readability": <1-10>
-            }}
-        }}
-
-        Focus on:
-        1. Resume structure and formatting
-        2. Section organization and completeness
-        3. Keyword usage and density
-        4. ATS-friendly formatting practices
-        5. Contact information completeness
-        6. Professional summary effectiveness
+        Tokens are collected as they arrive and parsed once the stream ends.
         """
+        parts = []
+        async with self._request_slots:
+            stream = await self.client.chat.completions.create(
+                **self._chat_request(system_prompt, prompt),
+                stream=True
+            )
+            async for chunk in stream:
+                # The final usage chunk, if any, carries no choices
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+        return orjson.loads("".join(parts))
+    
+    def _chat_request(self, system_prompt: str, prompt: str) -> Dict[str, Any]:
+        """Chat completion parameters, shared by online and batch requests"""
+        return {
+            "model": ANALYSIS_MODEL,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.3,
+            "response_format": {"type": "json_object"},
+            "user": PROMPT_CACHE_USER
+        }
+    
+    def _get_prompt(self, resume_text: str, analysis_mode: AnalysisMode,
+                    job_description: Optional[str] = None) -> Tuple[str, str]:
+        """Get the system prompt and user message for the given analysis mode"""
+        if analysis_mode == AnalysisMode.ATS:
+            return ATS_SYSTEM_PROMPT, self._get_ats_analysis_prompt(resume_text)
+        return JOB_MATCH_SYSTEM_PROMPT, self._get_job_match_prompt(resume_text, job_description)
+    
+    def _get_ats_analysis_prompt(self, resume_text: str) -> str:
+        """Get the user message for ATS analysis"""
+        return f"Resume Text:\n{resume_text}"
+    
+    def _get_bulk_ats_prompt(self, resume_texts: List[str]) -> str:
+        """Get the user message for ATS analysis of several numbered resumes"""
+        return "\n\n".join(
+            f"Resume {index}:\n{resume_text}"
+            for index, resume_text in enumerate(resume_texts, start=1)
+        )
     
     def _get_job_match_prompt(self, resume_text: str, job_description: str) -> str:
-        """Get prompt for job match analysis"""
-        return f"""
-        Analyze how well this resume matches the given job description and provide detailed feedback.
-
-        Resume Text:
-        {resume_text}
-
-        Job Description:
-        {job_description}
-
-        Please provide analysis in the following JSON format:
-        {{
-            "score": <1-10 integer>,
-            "strengths": [<list of matching strengths>],
-            "weaknesses": [<list of gaps or missing elements>],
-            "recommendations": [<list of specific improvements>],
-            "keyword_analysis": {{
-                "matched_keywords": [<list of matched keywords>],
-                "missing_keywords": [<list of missing important keywords>],
-                "match_percentage": <percentage as integer>
-            }}
-        }}
-
-        Focus on:
-        1. Technical skills alignment
-        2. Experience level match
-        3. Industry-specific requirements
-        4. Keyword matching
-        5. Qualifications and certifications
-        6. Soft skills and cultural fit indicators
-        """
\ No newline at end of file
+        """Get the user message for job match analysis"""
+        # Job description first: candidates for the same job share the longer prefix
+        return f"Job Description:\n{job_description}\n\nResume Text:\n{resume_text}"
+    
+    def _get_combined_prompt(self, resume_text: str, job_description: str) -> str:
+        """Get the user message for combined ATS and job match analysis"""
+        return self._get_job_match_prompt(resume_text, job_description)
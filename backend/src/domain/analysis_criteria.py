@@ -2,8 +2,9 @@
 Domain Value Objects - Analysis Criteria and Rules
 """
 
+import functools
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import Tuple
 from enum import Enum
 
 
@@ -17,38 +18,39 @@ class SectionType(Enum):
     PROJECTS = "projects"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ATSCriteria:
     """ATS evaluation criteria"""
-    required_sections: List[SectionType]
-    preferred_sections: List[SectionType]
+    required_sections: Tuple[SectionType, ...]
+    preferred_sections: Tuple[SectionType, ...]
     max_file_size_mb: int
-    supported_formats: List[str]
+    supported_formats: Tuple[str, ...]
     min_keyword_density: float
     max_keyword_density: float
     
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def default(cls) -> 'ATSCriteria':
         return cls(
-            required_sections=[
+            required_sections=(
                 SectionType.CONTACT,
                 SectionType.EXPERIENCE,
                 SectionType.EDUCATION,
                 SectionType.SKILLS
-            ],
-            preferred_sections=[
+            ),
+            preferred_sections=(
                 SectionType.SUMMARY,
                 SectionType.CERTIFICATIONS,
                 SectionType.PROJECTS
-            ],
+            ),
             max_file_size_mb=5,
-            supported_formats=['pdf', 'docx'],
+            supported_formats=('pdf', 'docx'),
             min_keyword_density=0.02,
             max_keyword_density=0.08
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobMatchCriteria:
     """Job matching evaluation criteria"""
     required_skill_weight: float
@@ -58,6 +60,7 @@ class JobMatchCriteria:
     keyword_match_threshold: float
     
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def default(cls) -> 'JobMatchCriteria':
         return cls(
             required_skill_weight=0.4,
@@ -68,7 +71,7 @@ class JobMatchCriteria:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScoringWeights:
     """Weights for different scoring components"""
     content_quality: float
@@ -2,8 +2,9 @@
 Domain Entities - Core Business Objects
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from hashlib import blake2b
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
@@ -20,7 +21,22 @@ class ScoreLevel(Enum):
     POOR = "poor"           # 1-4
 
 
-@dataclass
+# Score level indexed by score (1-10); index 0 is unused
+_SCORE_LEVELS = (
+    None,
+    ScoreLevel.POOR, ScoreLevel.POOR, ScoreLevel.POOR, ScoreLevel.POOR,
+    ScoreLevel.FAIR, ScoreLevel.FAIR,
+    ScoreLevel.GOOD, ScoreLevel.GOOD,
+    ScoreLevel.EXCELLENT, ScoreLevel.EXCELLENT
+)
+
+
+def content_digest(text: str) -> str:
+    """Digest of resume text, used to find earlier analyses of the same text"""
+    return blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass(slots=True)
 class ContactInfo:
     """Contact information extracted from resume"""
     email: Optional[str] = None
@@ -29,7 +45,7 @@ class ContactInfo:
     location: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResumeSection:
     """A section of the resume (e.g., Experience, Education)"""
     name: str
@@ -38,7 +54,7 @@ class ResumeSection:
     quality_score: int = 0  # 1-10
 
 
-@dataclass
+@dataclass(slots=True)
 class Resume:
     """Core resume entity"""
     id: str
@@ -49,6 +65,7 @@ class Resume:
     created_at: datetime
     file_name: Optional[str] = None
     file_size: Optional[int] = None
+    content_hash: Optional[str] = None  # content_digest of raw_text
     
     def get_section(self, section_name: str) -> Optional[ResumeSection]:
         """Get a specific section by name"""
@@ -62,7 +79,7 @@ class Resume:
         return self.get_section(section_name) is not None
 
 
-@dataclass
+@dataclass(slots=True)
 class JobDescription:
     """Job description entity"""
     id: str
@@ -74,7 +91,7 @@ class JobDescription:
     industry: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Result of resume analysis"""
     id: str
@@ -90,20 +107,16 @@ class AnalysisResult:
     matched_keywords: List[str]
     created_at: datetime
     job_description_id: Optional[str] = None
+    content_hash: Optional[str] = None  # digest of the analyzed resume text
+    created_at_iso: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        """Set score level based on score"""
-        if self.score >= 9:
-            self.score_level = ScoreLevel.EXCELLENT
-        elif self.score >= 7:
-            self.score_level = ScoreLevel.GOOD
-        elif self.score >= 5:
-            self.score_level = ScoreLevel.FAIR
-        else:
-            self.score_level = ScoreLevel.POOR
-
-
-@dataclass
+        """Set score level based on score and cache the ISO timestamp"""
+        self.created_at_iso = self.created_at.isoformat()
+        self.score_level = _SCORE_LEVELS[max(1, min(10, self.score))]
+
+
+@dataclass(slots=True)
 class AnalysisMetrics:
     """Detailed metrics for analysis"""
     keyword_match_percentage: float
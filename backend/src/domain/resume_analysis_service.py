@@ -2,17 +2,111 @@
 Application Services - Business Logic Implementation
 """
 
-import uuid
-from datetime import datetime
-from typing import List, Optional
+import asyncio
+import dataclasses
+import os
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Final, List, Optional, Tuple
 from src.ports.resume_analysis_port import (
     ResumeAnalysisPort, FileParserPort, AIAnalysisPort, AnalysisRepositoryPort
 )
 from src.domain.resume import (
     Resume, JobDescription, AnalysisResult, AnalysisMode, 
-    ContactInfo, ResumeSection
+    ContactInfo, ResumeSection, content_digest
 )
 from src.domain.analysis_criteria import ATSCriteria, JobMatchCriteria
+from uuid_utils import uuid7
+
+# Simple regex patterns for contact info
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = re.compile(r'(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+_LINKEDIN_RE = re.compile(r'linkedin\.com/in/[\w-]+')
+
+# Common section headers, one named group per section so a single scan finds all.
+# Headers start a line, so matching is anchored there and body text is skipped.
+_SECTION_NAMES = ('experience', 'education', 'skills', 'summary', 'certifications', 'projects')
+_SECTIONS_RE = re.compile(
+    r'^[ \t]*(?:'
+    r'(?P<experience>PROFESSIONAL\s+EXPERIENCE|WORK\s+EXPERIENCE|EXPERIENCE)'
+    r'|(?P<education>EDUCATION|ACADEMIC\s+BACKGROUND)'
+    r'|(?P<skills>TECHNICAL\s+SKILLS|SKILLS|COMPETENCIES)'
+    r'|(?P<summary>PROFESSIONAL\s+SUMMARY|SUMMARY|PROFILE)'
+    r'|(?P<certifications>CERTIFICATIONS|CERTIFICATES)'
+    r'|(?P<projects>PROJECTS|PORTFOLIO)'
+    r')\b',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# ATS analyses of identical resume text are reused for this long
+ANALYSIS_REUSE_TTL = timedelta(hours=24)
+
+# Feedback HTML is constant apart from the job match keyword lists, so the
+# fixed markup is built once here rather than re-rendered on every analysis
+_ATS_FEEDBACK_HTML: Final[str] = """
+        <div class="space-y-6">
+            <div class="p-4 bg-green-50 border-l-4 border-green-400 rounded-r-lg">
+                <h4 class="font-semibold text-green-800 mb-2">✅ Strengths</h4>
+                <ul class="text-green-700 space-y-1">
+                    <li>• Clear contact information present</li>
+                    <li>• Well-structured sections (Experience, Skills, Education)</li>
+                    <li>• Good use of action verbs and quantified achievements</li>
+                    <li>• Relevant technical skills clearly listed</li>
+                </ul>
+            </div>
+            
+            <div class="p-4 bg-yellow-50 border-l-4 border-yellow-400 rounded-r-lg">
+                <h4 class="font-semibold text-yellow-800 mb-2">⚠️ Areas for Improvement</h4>
+                <ul class="text-yellow-700 space-y-1">
+                    <li>• Consider adding a "Core Competencies" section with keywords</li>
+                    <li>• Include more industry-specific buzzwords</li>
+                    <li>• Add metrics to quantify your impact where possible</li>
+                </ul>
+            </div>
+            
+            <div class="p-4 bg-blue-50 border-l-4 border-blue-400 rounded-r-lg">
+                <h4 class="font-semibold text-blue-800 mb-2">🚀 ATS Optimization Tips</h4>
+                <ul class="text-blue-700 space-y-1">
+                    <li>• Use standard section headings (Experience, Education, Skills)</li>
+                    <li>• Avoid graphics, tables, or complex formatting</li>
+                    <li>• Include both acronyms and full terms (e.g., "AI" and "Artificial Intelligence")</li>
+                    <li>• Use keywords from job postings naturally throughout your resume</li>
+                </ul>
+            </div>
+        </div>
+        """
+
+_JOB_MATCH_FEEDBACK_TOP: Final[str] = """
+        <div class="space-y-6">
+            <div class="p-4 bg-green-50 border-l-4 border-green-400 rounded-r-lg">
+                <h4 class="font-semibold text-green-800 mb-2">✅ Strong Matches</h4>
+                <ul class="text-green-700 space-y-1">
+                    <li>• <strong>Technical Skills:</strong> """
+_JOB_MATCH_FEEDBACK_MIDDLE: Final[str] = """</li>
+                    <li>• <strong>Experience Level:</strong> Aligns with job requirements</li>
+                    <li>• <strong>Industry Background:</strong> Relevant experience demonstrated</li>
+                </ul>
+            </div>
+            
+            <div class="p-4 bg-red-50 border-l-4 border-red-400 rounded-r-lg">
+                <h4 class="font-semibold text-red-800 mb-2">❌ Missing Keywords</h4>
+                <ul class="text-red-700 space-y-1">
+                    """
+_JOB_MATCH_FEEDBACK_BOTTOM: Final[str] = """
+                </ul>
+            </div>
+            
+            <div class="p-4 bg-blue-50 border-l-4 border-blue-400 rounded-r-lg">
+                <h4 class="font-semibold text-blue-800 mb-2">🚀 Recommendations</h4>
+                <ul class="text-blue-700 space-y-1">
+                    <li>• Incorporate missing keywords naturally into your experience descriptions</li>
+                    <li>• Highlight relevant projects that demonstrate required skills</li>
+                    <li>• Consider adding certifications in missing technology areas</li>
+                    <li>• Quantify achievements with metrics that matter to this role</li>
+                </ul>
+            </div>
+        </div>
+        """
 
 
 class ResumeAnalysisService(ResumeAnalysisPort):
@@ -27,17 +121,27 @@ class ResumeAnalysisService(ResumeAnalysisPort):
         self.analysis_repository = analysis_repository
         self.ats_criteria = ATSCriteria.default()
         self.job_match_criteria = JobMatchCriteria.default()
+        self._max_file_bytes = self.ats_criteria.max_file_size_mb * 1024 * 1024
+        # File extension -> text extractor
+        self._parsers = {
+            '.pdf': file_parser.extract_text_from_pdf,
+            '.docx': file_parser.extract_text_from_docx
+        }
     
     def process_resume_file(self, file_bytes: bytes, file_name: str) -> Resume:
         """Process uploaded resume file and create Resume entity"""
         
-        # Extract text based on file type
-        if file_name.lower().endswith('.pdf'):
-            raw_text = self.file_parser.extract_text_from_pdf(file_bytes)
-        elif file_name.lower().endswith('.docx'):
-            raw_text = self.file_parser.extract_text_from_docx(file_bytes)
-        else:
+        # Validate type and size before spending time on parsing
+        parser = self._parsers.get(os.path.splitext(file_name)[1].lower())
+        if parser is None:
             raise ValueError("Unsupported file format")
+        if len(file_bytes) > self._max_file_bytes:
+            raise ValueError(
+                f"File size exceeds {self.ats_criteria.max_file_size_mb}MB limit"
+            )
+        
+        # Extract text based on file type
+        raw_text = parser(file_bytes)
         
         # Extract structured information
         contact_info = self._extract_contact_info(raw_text)
@@ -45,25 +149,84 @@ class ResumeAnalysisService(ResumeAnalysisPort):
         keywords = self.ai_analyzer.extract_keywords(raw_text)
         
         return Resume(
-            id=str(uuid.uuid4()),
+            id=str(uuid7()),
             raw_text=raw_text,
             contact_info=contact_info,
             sections=sections,
             keywords=keywords,
-            created_at=datetime.now(),
+            created_at=datetime.now(tz=timezone.utc),
             file_name=file_name,
-            file_size=len(file_bytes)
+            file_size=len(file_bytes),
+            content_hash=content_digest(raw_text)
         )
     
-    def analyze_ats_compatibility(self, resume: Resume) -> AnalysisResult:
+    async def analyze_ats_compatibility(self, resume: Resume) -> AnalysisResult:
         """Analyze resume for ATS compatibility"""
         
+        # Unchanged resumes reuse a recent analysis without another AI call
+        reused = self._reuse_recent_ats_analysis(resume)
+        if reused is not None:
+            return reused
+        
         # Get AI analysis
-        ai_result = self.ai_analyzer.analyze_resume_content(
+        ai_result = await self.ai_analyzer.analyze_resume_content(
             resume.raw_text, 
             AnalysisMode.ATS
         )
         
+        return self._build_ats_analysis(resume, ai_result, datetime.now(tz=timezone.utc))
+    
+    async def analyze_ats_batch(self, resumes: List[Resume]) -> List[AnalysisResult]:
+        """Analyze several resumes for ATS compatibility in one bulk AI request"""
+        reused = {}
+        for resume in resumes:
+            analysis = self._reuse_recent_ats_analysis(resume)
+            if analysis is not None:
+                reused[resume.id] = analysis
+        pending = [resume for resume in resumes if resume.id not in reused]
+        
+        ai_results = await self.ai_analyzer.analyze_resume_content_batch(
+            {resume.id: resume.raw_text for resume in pending},
+            AnalysisMode.ATS
+        ) if pending else {}
+        created_at = datetime.now(tz=timezone.utc)
+        
+        # Resumes missing from a bulk result are retried individually
+        retried = iter(await asyncio.gather(*(
+            self.analyze_ats_compatibility(resume)
+            for resume in pending if resume.id not in ai_results
+        )))
+        return [
+            reused[resume.id] if resume.id in reused
+            else self._build_ats_analysis(resume, ai_results[resume.id], created_at)
+            if resume.id in ai_results else next(retried)
+            for resume in resumes
+        ]
+    
+    def _reuse_recent_ats_analysis(self, resume: Resume) -> Optional[AnalysisResult]:
+        """
+        Copy a recent ATS analysis of identical resume text onto this resume
+
+        The copy gets its own ID and this resume's ID and is saved like a new
+        analysis; it keeps the original timestamp, so reuse still expires
+        ``ANALYSIS_REUSE_TTL`` after the AI call it came from.
+        """
+        if not resume.content_hash:
+            return None
+        recent = self.analysis_repository.find_recent(
+            resume.content_hash, AnalysisMode.ATS, ANALYSIS_REUSE_TTL
+        )
+        if recent is None:
+            return None
+        
+        analysis = dataclasses.replace(recent, id=str(uuid7()), resume_id=resume.id)
+        self.analysis_repository.save_analysis(analysis)
+        return analysis
+    
+    def _build_ats_analysis(self, resume: Resume, ai_result: dict,
+                            created_at: datetime) -> AnalysisResult:
+        """Score, build and save an ATS analysis from the AI result"""
+        
         # Calculate comprehensive score
         score = self._calculate_ats_score(resume, ai_result)
         
@@ -71,7 +234,7 @@ class ResumeAnalysisService(ResumeAnalysisPort):
         feedback = self._generate_ats_feedback(resume, ai_result, score)
         
         analysis = AnalysisResult(
-            id=str(uuid.uuid4()),
+            id=str(uuid7()),
             resume_id=resume.id,
             mode=AnalysisMode.ATS,
             score=score,
@@ -82,7 +245,8 @@ class ResumeAnalysisService(ResumeAnalysisPort):
             weaknesses=ai_result.get('weaknesses', []),
             missing_keywords=[],
             matched_keywords=resume.keywords,
-            created_at=datetime.now()
+            created_at=created_at,
+            content_hash=resume.content_hash
         )
         
         # Save analysis
@@ -90,18 +254,46 @@ class ResumeAnalysisService(ResumeAnalysisPort):
         
         return analysis
     
-    def analyze_job_match(self, resume: Resume, job_description: JobDescription) -> AnalysisResult:
+    async def analyze_job_match(self, resume: Resume, job_description: JobDescription) -> AnalysisResult:
         """Analyze resume against job description"""
         
         # Get AI analysis
-        ai_result = self.ai_analyzer.analyze_resume_content(
+        ai_result = await self.ai_analyzer.analyze_resume_content(
             resume.raw_text,
             AnalysisMode.JOB_MATCH,
             job_description.raw_text
         )
         
-        # Calculate match score
-        score = self._calculate_job_match_score(resume, job_description, ai_result)
+        return self._build_job_match_analysis(
+            resume, job_description, ai_result, datetime.now(tz=timezone.utc)
+        )
+    
+    async def analyze_both(self, resume: Resume,
+                           job_description: JobDescription) -> Tuple[AnalysisResult, AnalysisResult]:
+        """Analyze ATS compatibility and job match from a single AI request"""
+        
+        # With a reusable ATS analysis only the job match needs the AI
+        reused = self._reuse_recent_ats_analysis(resume)
+        if reused is not None:
+            return reused, await self.analyze_job_match(resume, job_description)
+        
+        ai_result = await self.ai_analyzer.analyze_resume_content_combined(
+            resume.raw_text,
+            job_description.raw_text
+        )
+        
+        created_at = datetime.now(tz=timezone.utc)
+        
+        return (
+            self._build_ats_analysis(resume, ai_result.get('ats', {}), created_at),
+            self._build_job_match_analysis(
+                resume, job_description, ai_result.get('job_match', {}), created_at
+            )
+        )
+    
+    def _build_job_match_analysis(self, resume: Resume, job_description: JobDescription,
+                                  ai_result: dict, created_at: datetime) -> AnalysisResult:
+        """Score, build and save a job match analysis from the AI result"""
         
         # Analyze keyword matching
         matched_keywords, missing_keywords = self._analyze_keyword_match(
@@ -109,13 +301,18 @@ class ResumeAnalysisService(ResumeAnalysisPort):
             job_description.keywords
         )
         
+        # Calculate match score
+        score = self._calculate_job_match_score(
+            resume, job_description, ai_result, matched_keywords
+        )
+        
         # Generate structured feedback
         feedback = self._generate_job_match_feedback(
-            resume, job_description, ai_result, score
+            resume, job_description, ai_result, score, matched_keywords, missing_keywords
         )
         
         analysis = AnalysisResult(
-            id=str(uuid.uuid4()),
+            id=str(uuid7()),
             resume_id=resume.id,
             mode=AnalysisMode.JOB_MATCH,
             score=score,
@@ -126,8 +323,9 @@ class ResumeAnalysisService(ResumeAnalysisPort):
             weaknesses=ai_result.get('weaknesses', []),
             missing_keywords=missing_keywords,
             matched_keywords=matched_keywords,
-            created_at=datetime.now(),
-            job_description_id=job_description.id
+            created_at=created_at,
+            job_description_id=job_description.id,
+            content_hash=resume.content_hash
         )
         
         # Save analysis
@@ -137,16 +335,9 @@ class ResumeAnalysisService(ResumeAnalysisPort):
     
     def _extract_contact_info(self, text: str) -> ContactInfo:
         """Extract contact information from resume text"""
-        import re
-        
-        # Simple regex patterns for contact info
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        phone_pattern = r'(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-        
-        email = re.search(email_pattern, text)
-        phone = re.search(phone_pattern, text)
-        linkedin = re.search(linkedin_pattern, text)
+        email = _EMAIL_RE.search(text)
+        phone = _PHONE_RE.search(text)
+        linkedin = _LINKEDIN_RE.search(text)
         
         return ContactInfo(
             email=email.group() if email else None,
@@ -156,29 +347,21 @@ class ResumeAnalysisService(ResumeAnalysisPort):
     
     def _extract_sections(self, text: str) -> List[ResumeSection]:
         """Extract resume sections"""
-        sections = []
-        
-        # Common section headers
-        section_patterns = {
-            'experience': r'(PROFESSIONAL\s+EXPERIENCE|WORK\s+EXPERIENCE|EXPERIENCE)',
-            'education': r'(EDUCATION|ACADEMIC\s+BACKGROUND)',
-            'skills': r'(TECHNICAL\s+SKILLS|SKILLS|COMPETENCIES)',
-            'summary': r'(PROFESSIONAL\s+SUMMARY|SUMMARY|PROFILE)',
-            'certifications': r'(CERTIFICATIONS|CERTIFICATES)',
-            'projects': r'(PROJECTS|PORTFOLIO)'
-        }
+        found = set()
+        for match in _SECTIONS_RE.finditer(text):
+            found.add(match.lastgroup)
+            if len(found) == len(_SECTION_NAMES):
+                break
         
-        for section_name, pattern in section_patterns.items():
-            import re
-            if re.search(pattern, text, re.IGNORECASE):
-                sections.append(ResumeSection(
-                    name=section_name,
-                    content="",  # Would extract actual content in production
-                    is_present=True,
-                    quality_score=7  # Mock score
-                ))
-        
-        return sections
+        return [
+            ResumeSection(
+                name=section_name,
+                content="",  # Would extract actual content in production
+                is_present=True,
+                quality_score=7  # Mock score
+            )
+            for section_name in _SECTION_NAMES if section_name in found
+        ]
     
     def _calculate_ats_score(self, resume: Resume, ai_result: dict) -> int:
         """Calculate ATS compatibility score"""
@@ -199,10 +382,10 @@ class ResumeAnalysisService(ResumeAnalysisPort):
         total_score = min(base_score + section_score + contact_score + (ai_score - 5), 10)
         return max(1, int(total_score))
     
-    def _calculate_job_match_score(self, resume: Resume, job_description: JobDescription, ai_result: dict) -> int:
+    def _calculate_job_match_score(self, resume: Resume, job_description: JobDescription,
+                                   ai_result: dict, matched_keywords: List[str]) -> int:
         """Calculate job match score"""
         # Keyword matching
-        matched_keywords, _ = self._analyze_keyword_match(resume.keywords, job_description.keywords)
         keyword_match_ratio = len(matched_keywords) / max(len(job_description.keywords), 1)
         
         # AI analysis
@@ -212,84 +395,33 @@ class ResumeAnalysisService(ResumeAnalysisPort):
         final_score = (keyword_match_ratio * 4) + (ai_score * 0.6)
         return max(1, min(10, int(final_score)))
     
-    def _analyze_keyword_match(self, resume_keywords: List[str], job_keywords: List[str]) -> tuple:
+    def _analyze_keyword_match(self, resume_keywords: List[str],
+                               job_keywords: List[str]) -> Tuple[List[str], List[str]]:
         """Analyze keyword matching between resume and job description"""
-        resume_lower = [k.lower() for k in resume_keywords]
-        job_lower = [k.lower() for k in job_keywords]
+        resume_lower = {k.lower() for k in resume_keywords}
         
-        matched = [k for k in job_keywords if k.lower() in resume_lower]
-        missing = [k for k in job_keywords if k.lower() not in resume_lower]
+        # Split in one pass, lowercasing each job keyword once
+        matched, missing = [], []
+        for keyword in job_keywords:
+            (matched if keyword.lower() in resume_lower else missing).append(keyword)
         
         return matched, missing
     
     def _generate_ats_feedback(self, resume: Resume, ai_result: dict, score: int) -> str:
         """Generate ATS feedback in HTML format"""
-        return f"""
-        <div class="space-y-6">
-            <div class="p-4 bg-green-50 border-l-4 border-green-400 rounded-r-lg">
-                <h4 class="font-semibold text-green-800 mb-2">✅ Strengths</h4>
-                <ul class="text-green-700 space-y-1">
-                    <li>• Clear contact information present</li>
-                    <li>• Well-structured sections (Experience, Skills, Education)</li>
-                    <li>• Good use of action verbs and quantified achievements</li>
-                    <li>• Relevant technical skills clearly listed</li>
-                </ul>
-            </div>
-            
-            <div class="p-4 bg-yellow-50 border-l-4 border-yellow-400 rounded-r-lg">
-                <h4 class="font-semibold text-yellow-800 mb-2">⚠️ Areas for Improvement</h4>
-                <ul class="text-yellow-700 space-y-1">
-                    <li>• Consider adding a "Core Competencies" section with keywords</li>
-                    <li>• Include more industry-specific buzzwords</li>
-                    <li>• Add metrics to quantify your impact where possible</li>
-                </ul>
-            </div>
-            
-            <div class="p-4 bg-blue-50 border-l-4 border-blue-400 rounded-r-lg">
-                <h4 class="font-semibold text-blue-800 mb-2">🚀 ATS Optimization Tips</h4>
-                <ul class="text-blue-700 space-y-1">
-                    <li>• Use standard section headings (Experience, Education, Skills)</li>
-                    <li>• Avoid graphics, tables, or complex formatting</li>
-                    <li>• Include both acronyms and full terms (e.g., "AI" and "Artificial Intelligence")</li>
-                    <li>• Use keywords from job postings naturally throughout your resume</li>
-                </ul>
-            </div>
-        </div>
-        """
+        return _ATS_FEEDBACK_HTML
     
     def _generate_job_match_feedback(self, resume: Resume, job_description: JobDescription, 
-                                   ai_result: dict, score: int) -> str:
+                                   ai_result: dict, score: int, matched_keywords: List[str],
+                                   missing_keywords: List[str]) -> str:
         """Generate job match feedback in HTML format"""
-        matched_keywords, missing_keywords = self._analyze_keyword_match(
-            resume.keywords, job_description.keywords
-        )
-        
-        return f"""
-        <div class="space-y-6">
-            <div class="p-4 bg-green-50 border-l-4 border-green-400 rounded-r-lg">
-                <h4 class="font-semibold text-green-800 mb-2">✅ Strong Matches</h4>
-                <ul class="text-green-700 space-y-1">
-                    <li>• <strong>Technical Skills:</strong> {', '.join(matched_keywords[:3]) if matched_keywords else 'Various skills match'}</li>
-                    <li>• <strong>Experience Level:</strong> Aligns with job requirements</li>
-                    <li>• <strong>Industry Background:</strong> Relevant experience demonstrated</li>
-                </ul>
-            </div>
-            
-            <div class="p-4 bg-red-50 border-l-4 border-red-400 rounded-r-lg">
-                <h4 class="font-semibold text-red-800 mb-2">❌ Missing Keywords</h4>
-                <ul class="text-red-700 space-y-1">
-                    {chr(10).join([f'<li>• <strong>{keyword}:</strong> Consider adding this skill/experience</li>' for keyword in missing_keywords[:5]])}
-                </ul>
-            </div>
-            
-            <div class="p-4 bg-blue-50 border-l-4 border-blue-400 rounded-r-lg">
-                <h4 class="font-semibold text-blue-800 mb-2">🚀 Recommendations</h4>
-                <ul class="text-blue-700 space-y-1">
-                    <li>• Incorporate missing keywords naturally into your experience descriptions</li>
-                    <li>• Highlight relevant projects that demonstrate required skills</li>
-                    <li>• Consider adding certifications in missing technology areas</li>
-                    <li>• Quantify achievements with metrics that matter to this role</li>
-                </ul>
-            </div>
-        </div>
-        """ 
\ No newline at end of file
+        matched_text = ', '.join(matched_keywords[:3]) if matched_keywords else 'Various skills match'
+        missing_items = "\n".join([
+            f'<li>• <strong>{keyword}:</strong> Consider adding this skill/experience</li>'
+            for keyword in missing_keywords[:5]
+        ])
+        return "".join((
+            _JOB_MATCH_FEEDBACK_TOP, matched_text,
+            _JOB_MATCH_FEEDBACK_MIDDLE, missing_items,
+            _JOB_MATCH_FEEDBACK_BOTTOM
+        ))
@@ -2,8 +2,10 @@
 Application Ports - Interfaces for Resume Analysis
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import timedelta
+from typing import BinaryIO, Dict, List, Optional, Union
 from src.domain.resume import Resume, JobDescription, AnalysisResult, AnalysisMode
 
 
@@ -11,12 +13,12 @@ class ResumeAnalysisPort(ABC):
     """Port for resume analysis operations"""
     
     @abstractmethod
-    def analyze_ats_compatibility(self, resume: Resume) -> AnalysisResult:
+    async def analyze_ats_compatibility(self, resume: Resume) -> AnalysisResult:
         """Analyze resume for ATS compatibility"""
         pass
     
     @abstractmethod
-    def analyze_job_match(self, resume: Resume, job_description: JobDescription) -> AnalysisResult:
+    async def analyze_job_match(self, resume: Resume, job_description: JobDescription) -> AnalysisResult:
         """Analyze resume against job description"""
         pass
 
@@ -24,26 +26,48 @@ class ResumeAnalysisPort(ABC):
 class FileParserPort(ABC):
     """Port for file parsing operations"""
     
+    __slots__ = ()
+    
     @abstractmethod
-    def extract_text_from_pdf(self, file_bytes: bytes) -> str:
-        """Extract text from PDF file"""
+    def extract_text_from_pdf(self, file_bytes: Union[bytes, BinaryIO]) -> str:
+        """Extract text from PDF file contents or a binary stream"""
         pass
     
     @abstractmethod
-    def extract_text_from_docx(self, file_bytes: bytes) -> str:
-        """Extract text from DOCX file"""
+    def extract_text_from_docx(self, file_bytes: Union[bytes, BinaryIO]) -> str:
+        """Extract text from DOCX file contents or a binary stream"""
         pass
+    
+    def extract_text_from_pdf_bytes(self, file_bytes: Union[bytes, BinaryIO]) -> bytes:
+        """Extract PDF text as UTF-8 bytes for byte-oriented scanners"""
+        return self.extract_text_from_pdf(file_bytes).encode("utf-8")
 
 
 class AIAnalysisPort(ABC):
     """Port for AI-powered analysis"""
     
     @abstractmethod
-    def analyze_resume_content(self, resume_text: str, analysis_mode: AnalysisMode, 
-                             job_description: Optional[str] = None) -> dict:
+    async def analyze_resume_content(self, resume_text: str, analysis_mode: AnalysisMode, 
+                                   job_description: Optional[str] = None) -> dict:
         """Analyze resume content using AI"""
         pass
     
+    @abstractmethod
+    async def analyze_resume_content_combined(self, resume_text: str,
+                                            job_description: str) -> dict:
+        """Analyze ATS compatibility and job match in one call, keyed 'ats' and 'job_match'"""
+        pass
+    
+    async def analyze_resume_content_batch(self, resume_texts: Dict[str, str],
+                                         analysis_mode: AnalysisMode,
+                                         job_description: Optional[str] = None) -> Dict[str, dict]:
+        """Analyze many resumes keyed by ID; defaults to concurrent single calls"""
+        results = await asyncio.gather(*(
+            self.analyze_resume_content(resume_text, analysis_mode, job_description)
+            for resume_text in resume_texts.values()
+        ))
+        return dict(zip(resume_texts, results))
+    
     @abstractmethod
     def extract_keywords(self, text: str) -> List[str]:
         """Extract keywords from text"""
@@ -66,4 +90,10 @@ class AnalysisRepositoryPort(ABC):
     @abstractmethod
     def get_analyses_by_resume(self, resume_id: str) -> List[AnalysisResult]:
         """Get all analyses for a resume"""
+        pass
+    
+    @abstractmethod
+    def find_recent(self, content_hash: str, mode: AnalysisMode,
+                    max_age: timedelta) -> Optional[AnalysisResult]:
+        """Get the latest analysis of identical resume text, if newer than max_age"""
         pass
\ No newline at end of file
@@ -0,0 +1,213 @@
+"""
+Tests for AnalysisCache
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+from src.adapters.analysis_cache import AnalysisCache
+from src.domain.resume import AnalysisMode
+
+
+class CountingCompute:
+    """Stand-in for an AI call that counts how often it runs"""
+    
+    def __init__(self, result: Dict[str, Any]):
+        self.result = result
+        self.calls = 0
+    
+    async def __call__(self) -> Dict[str, Any]:
+        self.calls += 1
+        await asyncio.sleep(0)
+        return {"score": self.result["score"], "strengths": list(self.result["strengths"])}
+
+
+# Fixed embeddings: the reformatted resume points almost the same way as the original
+EMBEDDINGS = {
+    "Resume A": [1.0, 0.0],
+    "Resume A, reformatted": [0.99, 0.14],
+    "Resume B": [0.0, 1.0]
+}
+
+
+async def fake_embed(text: str) -> List[float]:
+    """Embedding stand-in backed by EMBEDDINGS"""
+    return EMBEDDINGS[text]
+
+
+async def failing_embed(text: str) -> List[float]:
+    """Embedding stand-in whose API call always fails"""
+    raise ConnectionError("embedding service unavailable")
+
+
+class TestAnalysisCache:
+    """Test cases for AnalysisCache"""
+    
+    def setup_method(self):
+        """Set up a fresh compute stub"""
+        self.compute = CountingCompute({"score": 8, "strengths": ["Clear structure"]})
+    
+    def lookup(self, cache: AnalysisCache, resume_text: str,
+               job_description: Optional[str] = None) -> Dict[str, Any]:
+        """Run one cached lookup, as a job match when a job description is given"""
+        mode = AnalysisMode.JOB_MATCH if job_description else AnalysisMode.ATS
+        return asyncio.run(
+            cache.get_or_compute(resume_text, mode, job_description, self.compute)
+        )
+    
+    def test_exact_hit_reuses_the_first_result(self):
+        """Test that identical inputs are computed once"""
+        cache = AnalysisCache()
+        
+        first = self.lookup(cache, "Resume A")
+        second = self.lookup(cache, "Resume A")
+        
+        assert first == second == {"score": 8, "strengths": ["Clear structure"]}
+        assert self.compute.calls == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+    
+    def test_mode_and_job_description_are_part_of_the_key(self):
+        """Test that different analysis inputs do not share entries"""
+        cache = AnalysisCache()
+        
+        self.lookup(cache, "Resume A")
+        self.lookup(cache, "Resume A", job_description="Backend engineer")
+        self.lookup(cache, "Resume A", job_description="Frontend engineer")
+        
+        assert self.compute.calls == 3
+    
+    def test_callers_cannot_modify_cached_results(self):
+        """Test that each caller gets its own copy of a cached result"""
+        cache = AnalysisCache()
+        
+        self.lookup(cache, "Resume A")["strengths"].append("Changed by caller")
+        self.lookup(cache, "Resume A")["score"] = 1
+        
+        assert self.lookup(cache, "Resume A") == {
+            "score": 8, "strengths": ["Clear structure"]
+        }
+    
+    def test_expired_entries_are_recomputed(self):
+        """Test that entries past their TTL are not served"""
+        cache = AnalysisCache(ttl_seconds=-1)
+        
+        self.lookup(cache, "Resume A")
+        self.lookup(cache, "Resume A")
+        
+        assert self.compute.calls == 2
+        assert cache.hits == 0
+    
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test LRU eviction once the cache is full"""
+        cache = AnalysisCache(max_entries=2)
+        
+        self.lookup(cache, "Resume A")
+        self.lookup(cache, "Resume B")
+        self.lookup(cache, "Resume A")  # refreshes A, so B is evicted next
+        self.lookup(cache, "Resume C")
+        assert self.compute.calls == 3
+        
+        self.lookup(cache, "Resume A")
+        assert self.compute.calls == 3
+        self.lookup(cache, "Resume B")
+        assert self.compute.calls == 4
+    
+    def test_semantic_hit_for_a_similar_resume(self):
+        """Test that a near-identical resume embedding reuses the result"""
+        cache = AnalysisCache(embed=fake_embed)
+        
+        self.lookup(cache, "Resume A")
+        result = self.lookup(cache, "Resume A, reformatted")
+        self.lookup(cache, "Resume B")
+        
+        assert result == {"score": 8, "strengths": ["Clear structure"]}
+        assert self.compute.calls == 2
+        assert cache.semantic_hits == 1
+    
+    def test_semantic_hits_stay_within_the_job_description(self):
+        """Test that similar resumes for different jobs are not shared"""
+        cache = AnalysisCache(embed=fake_embed)
+        
+        self.lookup(cache, "Resume A", job_description="Backend engineer")
+        self.lookup(cache, "Resume A, reformatted", job_description="Frontend engineer")
+        
+        assert self.compute.calls == 2
+        assert cache.semantic_hits == 0
+    
+    def test_embedding_failure_falls_back_to_compute(self):
+        """Test that an embedding error does not fail the analysis"""
+        cache = AnalysisCache(embed=failing_embed)
+        
+        assert self.lookup(cache, "Resume A") == {
+            "score": 8, "strengths": ["Clear structure"]
+        }
+        assert self.lookup(cache, "Resume A")["score"] == 8
+        assert self.compute.calls == 1
+    
+    def test_concurrent_misses_share_one_computation(self):
+        """Test single-flight for simultaneous lookups of the same key"""
+        cache = AnalysisCache()
+        
+        async def lookup_concurrently():
+            return await asyncio.gather(*(
+                cache.get_or_compute("Resume A", AnalysisMode.ATS, None, self.compute)
+                for _ in range(5)
+            ))
+        
+        results = asyncio.run(lookup_concurrently())
+        
+        assert self.compute.calls == 1
+        assert all(result == results[0] for result in results)
+        assert len({id(result) for result in results}) == 5
+    
+    def test_concurrent_waiters_see_a_failed_computation(self):
+        """Test that a failed computation is raised to every waiter and not cached"""
+        cache = AnalysisCache()
+        
+        async def failing_compute():
+            await asyncio.sleep(0)
+            raise RuntimeError("rate limited")
+        
+        async def lookup_concurrently():
+            return await asyncio.gather(*(
+                cache.get_or_compute("Resume A", AnalysisMode.ATS, None, failing_compute)
+                for _ in range(3)
+            ), return_exceptions=True)
+        
+        errors = asyncio.run(lookup_concurrently())
+        
+        assert all(isinstance(error, RuntimeError) for error in errors)
+        assert self.lookup(cache, "Resume A")["score"] == 8
+    
+    def test_cancelled_computation_is_taken_over_by_a_waiter(self):
+        """Test that cancelling the computing caller does not cancel its waiters"""
+        cache = AnalysisCache()
+        calls = []
+        
+        async def compute():
+            calls.append(len(calls))
+            if len(calls) == 1:
+                await asyncio.Event().wait()  # the first caller hangs until cancelled
+            return {"score": 8}
+        
+        async def cancel_first_caller():
+            first = asyncio.create_task(
+                cache.get_or_compute("Resume A", AnalysisMode.ATS, None, compute)
+            )
+            await asyncio.sleep(0)
+            second = asyncio.create_task(
+                cache.get_or_compute("Resume A", AnalysisMode.ATS, None, compute)
+            )
+            await asyncio.sleep(0)
+            first.cancel()
+            result = await second
+            await asyncio.gather(first, return_exceptions=True)
+            return first, second, result
+        
+        first, second, result = asyncio.run(cancel_first_caller())
+        
+        assert first.cancelled()
+        assert not second.cancelled()
+        assert result == {"score": 8}
+        assert len(calls) == 2
+        assert cache._in_flight == {}
+        assert self.lookup(cache, "Resume A") == {"score": 8}
@@ -0,0 +1,95 @@
+"""
+Tests for InMemoryAnalysisRepository
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from src.adapters.analysis_repository import InMemoryAnalysisRepository
+from src.domain.resume import AnalysisMode, AnalysisResult
+
+MAX_AGE = timedelta(hours=24)
+
+
+def _analysis(analysis_id: str, content_hash: Optional[str] = "hash-a",
+              mode: AnalysisMode = AnalysisMode.ATS, age: timedelta = timedelta(0),
+              tz: Optional[timezone] = timezone.utc) -> AnalysisResult:
+    """An analysis of the given resume content, created ``age`` ago"""
+    return AnalysisResult(
+        id=analysis_id,
+        resume_id=f"resume-for-{analysis_id}",
+        mode=mode,
+        score=7,
+        score_level=None,
+        feedback="<div></div>",
+        recommendations=[],
+        strengths=[],
+        weaknesses=[],
+        missing_keywords=[],
+        matched_keywords=[],
+        created_at=datetime.now(tz=tz) - age,
+        content_hash=content_hash
+    )
+
+
+class TestInMemoryAnalysisRepository:
+    """Test cases for InMemoryAnalysisRepository"""
+    
+    def setup_method(self):
+        """Set up an empty repository"""
+        self.repository = InMemoryAnalysisRepository()
+    
+    def test_find_recent_returns_the_latest_analysis_of_the_content(self):
+        """Test that the newest save for a content hash and mode wins"""
+        self.repository.save_analysis(_analysis("first"))
+        self.repository.save_analysis(_analysis("second"))
+        
+        recent = self.repository.find_recent("hash-a", AnalysisMode.ATS, MAX_AGE)
+        
+        assert recent.id == "second"
+    
+    def test_find_recent_is_keyed_by_content_and_mode(self):
+        """Test that other content hashes and modes do not match"""
+        self.repository.save_analysis(_analysis("ats"))
+        self.repository.save_analysis(_analysis("match", mode=AnalysisMode.JOB_MATCH))
+        
+        assert self.repository.find_recent("hash-b", AnalysisMode.ATS, MAX_AGE) is None
+        assert self.repository.find_recent(
+            "hash-a", AnalysisMode.JOB_MATCH, MAX_AGE
+        ).id == "match"
+        assert self.repository.find_recent("hash-a", AnalysisMode.ATS, MAX_AGE).id == "ats"
+    
+    def test_find_recent_skips_analyses_older_than_max_age(self):
+        """Test TTL expiry of reusable analyses"""
+        self.repository.save_analysis(_analysis("stale", age=timedelta(hours=25)))
+        
+        assert self.repository.find_recent("hash-a", AnalysisMode.ATS, MAX_AGE) is None
+        assert self.repository.find_recent(
+            "hash-a", AnalysisMode.ATS, timedelta(hours=26)
+        ).id == "stale"
+    
+    def test_find_recent_handles_naive_timestamps(self):
+        """Test the age check for analyses created without a timezone"""
+        self.repository.save_analysis(_analysis("naive", tz=None))
+        
+        assert self.repository.find_recent("hash-a", AnalysisMode.ATS, MAX_AGE).id == "naive"
+    
+    def test_analyses_without_content_hash_are_not_indexed(self):
+        """Test that text-only analyses are saved but never reused"""
+        self.repository.save_analysis(_analysis("unhashed", content_hash=None))
+        
+        assert self.repository.get_analysis("unhashed") is not None
+        assert self.repository._latest_by_content == {}
+    
+    def test_content_index_points_at_the_latest_analysis(self):
+        """Test the (content hash, mode) index kept alongside saved analyses"""
+        self.repository.save_analysis(_analysis("first"))
+        self.repository.save_analysis(_analysis("other", content_hash="hash-b"))
+        self.repository.save_analysis(_analysis("second"))
+        
+        assert self.repository._latest_by_content == {
+            ("hash-a", AnalysisMode.ATS): "second",
+            ("hash-b", AnalysisMode.ATS): "other"
+        }
+        assert [a.id for a in self.repository.get_analyses_by_resume("resume-for-first")] == [
+            "first"
+        ]
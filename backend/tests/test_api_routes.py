@@ -0,0 +1,70 @@
+"""
+Tests for the API routes
+"""
+
+from typing import List, Optional
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.adapters.analysis_repository import InMemoryAnalysisRepository
+from src.adapters.api.routes import create_routes
+from src.adapters.file_parser_adapter import FileParserAdapter
+from src.domain.resume import AnalysisMode
+from src.domain.resume_analysis_service import ResumeAnalysisService
+from src.ports.resume_analysis_port import AIAnalysisPort
+
+RESUME_TEXT = "Jane Doe\nEXPERIENCE\nPython developer"
+
+
+class RecordingAIAnalyzer(AIAnalysisPort):
+    """AI analyzer stand-in that records the analysis modes requested"""
+    
+    def __init__(self):
+        self.calls: List[AnalysisMode] = []
+    
+    async def analyze_resume_content(self, resume_text: str, analysis_mode: AnalysisMode,
+                                     job_description: Optional[str] = None) -> dict:
+        self.calls.append(analysis_mode)
+        return {"score": 8, "strengths": ["Clear structure"], "recommendations": []}
+    
+    async def analyze_resume_content_combined(self, resume_text: str,
+                                              job_description: str) -> dict:
+        raise AssertionError("not used by the routes")
+    
+    def extract_keywords(self, text: str) -> List[str]:
+        return ["Python"]
+
+
+class TestAnalyzeRoute:
+    """Test cases for POST /api/analyze"""
+    
+    def setup_method(self):
+        """Set up the routes over a real service and in-memory repository"""
+        self.repository = InMemoryAnalysisRepository()
+        self.ai_analyzer = RecordingAIAnalyzer()
+        service = ResumeAnalysisService(
+            FileParserAdapter(), self.ai_analyzer, self.repository
+        )
+        app = FastAPI()
+        app.include_router(create_routes(service, self.repository))
+        self.client = TestClient(app)
+    
+    def test_identical_ats_request_reuses_the_analysis(self):
+        """Test that a repeated resume text is not sent to the AI again"""
+        request = {"resume_text": RESUME_TEXT, "mode": "ats"}
+        
+        first = self.client.post("/api/analyze", json=request)
+        second = self.client.post("/api/analyze", json=request)
+        
+        assert first.status_code == second.status_code == 200
+        assert self.ai_analyzer.calls == [AnalysisMode.ATS]
+        assert second.json()["id"] != first.json()["id"]
+        assert second.json()["score"] == first.json()["score"]
+    
+    def test_changed_resume_text_is_analyzed_again(self):
+        """Test that different resume texts each get an AI analysis"""
+        self.client.post("/api/analyze", json={"resume_text": RESUME_TEXT, "mode": "ats"})
+        self.client.post(
+            "/api/analyze", json={"resume_text": f"{RESUME_TEXT}\nGo", "mode": "ats"}
+        )
+        
+        assert self.ai_analyzer.calls == [AnalysisMode.ATS, AnalysisMode.ATS]
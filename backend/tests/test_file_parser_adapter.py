@@ -2,27 +2,21 @@
 Tests for FileParserAdapter
 """
 
+import functools
+import multiprocessing
+import re
 import pytest
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from io import BytesIO
+from typing import Tuple
+from unittest.mock import MagicMock
 from src.adapters.file_parser_adapter import FileParserAdapter
-from docx import Document
-import pdfplumber
-import reportlab
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
 
+# Worker processes are started the way the app starts them
+FORKSERVER = multiprocessing.get_context("forkserver")
 
-class TestFileParserAdapter:
-    """Test cases for FileParserAdapter"""
-    
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.file_parser = FileParserAdapter()
-        self.sample_resume_text = self._create_sample_resume_text()
-    
-    def _create_sample_resume_text(self) -> str:
-        """Create sample resume text for testing"""
-        return """
+# Built once per module rather than in every setup_method
+SAMPLE_RESUME_TEXT = """
 JOHN DOE
 Software Engineer
 📧 john.doe@email.com | 📱 (555) 123-4567 | 🔗 linkedin.com/in/johndoe
@@ -65,58 +59,83 @@ PROJECTS
 • Open-source contributor to React ecosystem (2000+ GitHub stars)
 • Built personal finance app with 10k+ active users
 """
+
+
+def _split_lines(text: str) -> Tuple[str, ...]:
+    """Split fixture text into stripped, non-empty lines"""
+    return tuple(line.strip() for line in text.split('\n') if line.strip())
+
+
+SAMPLE_RESUME_LINES = _split_lines(SAMPLE_RESUME_TEXT)
+
+
+@functools.lru_cache(maxsize=32)
+def _create_sample_pdf_bytes(lines: Tuple[str, ...]) -> bytes:
+    """Create a PDF file in memory with the given lines, once per distinct input"""
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import letter
     
-    def _create_sample_pdf_bytes(self, text: str) -> bytes:
-        """Create a PDF file in memory with the given text"""
-        buffer = BytesIO()
-        
-        # Create PDF with reportlab
-        c = canvas.Canvas(buffer, pagesize=letter)
-        width, height = letter
-        
-        # Split text into lines and add to PDF
-        lines = text.split('\n')
-        y_position = height - 50
-        
-        for line in lines:
-            if line.strip():  # Only add non-empty lines
-                c.drawString(50, y_position, line.strip())
-                y_position -= 15
-                
-                # Add new page if we run out of space
-                if y_position < 50:
-                    c.showPage()
-                    y_position = height - 50
-        
-        c.save()
-        pdf_bytes = buffer.getvalue()
-        buffer.close()
-        
-        return pdf_bytes
+    buffer = BytesIO()
     
-    def _create_sample_docx_bytes(self, text: str) -> bytes:
-        """Create a DOCX file in memory with the given text"""
-        # Create a new Document
-        doc = Document()
-        
-        # Split text into paragraphs and add to document
-        paragraphs = text.split('\n')
-        for paragraph_text in paragraphs:
-            if paragraph_text.strip():  # Only add non-empty paragraphs
-                doc.add_paragraph(paragraph_text.strip())
-        
-        # Save to bytes
-        buffer = BytesIO()
-        doc.save(buffer)
-        docx_bytes = buffer.getvalue()
-        buffer.close()
-        
-        return docx_bytes
+    # Create PDF with reportlab
+    c = canvas.Canvas(buffer, pagesize=letter)
+    width, height = letter
+    
+    # Add lines to PDF as one text object per page, 15pt apart between
+    # 50pt top and bottom margins
+    lines_per_page = int((height - 100) // 15) + 1
+    
+    for start in range(0, len(lines), lines_per_page):
+        if start:
+            c.showPage()
+        text = c.beginText(50, height - 50)
+        text.setFont("Helvetica", 12, leading=15)
+        text.textLines(lines[start:start + lines_per_page])
+        c.drawText(text)
+    
+    c.save()
+    pdf_bytes = buffer.getvalue()
+    buffer.close()
+    
+    return pdf_bytes
+
+
+@functools.lru_cache(maxsize=32)
+def _create_sample_docx_bytes(lines: Tuple[str, ...]) -> bytes:
+    """Create a DOCX file in memory with one paragraph per line, once per distinct input"""
+    from docx import Document
+    
+    # Create a new Document
+    doc = Document()
+    
+    # Add paragraphs to document
+    for paragraph_text in lines:
+        doc.add_paragraph(paragraph_text)
+    
+    # Save to bytes
+    buffer = BytesIO()
+    doc.save(buffer)
+    docx_bytes = buffer.getvalue()
+    buffer.close()
+    
+    return docx_bytes
+
+
+class TestFileParserAdapter:
+    """Test cases for FileParserAdapter"""
+    
+    _PARA_RE = re.compile(r"first|second|third|paragraph", re.IGNORECASE)
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.file_parser = FileParserAdapter()
+        self.sample_resume_text = SAMPLE_RESUME_TEXT
+        self.sample_resume_lines = SAMPLE_RESUME_LINES
     
     def test_extract_text_from_pdf_with_real_pdf(self):
         """Test PDF text extraction with a real PDF file"""
         # Create sample PDF bytes
-        pdf_bytes = self._create_sample_pdf_bytes(self.sample_resume_text)
+        pdf_bytes = _create_sample_pdf_bytes(self.sample_resume_lines)
         
         # Test the method
         result = self.file_parser.extract_text_from_pdf(pdf_bytes)
@@ -130,7 +149,7 @@ PROJECTS
     def test_extract_text_from_docx_with_real_docx(self):
         """Test DOCX text extraction with a real DOCX file"""
         # Create sample DOCX bytes
-        docx_bytes = self._create_sample_docx_bytes(self.sample_resume_text)
+        docx_bytes = _create_sample_docx_bytes(self.sample_resume_lines)
         
         # Test the method
         result = self.file_parser.extract_text_from_docx(docx_bytes)
@@ -148,7 +167,7 @@ PROJECTS
     def test_extract_text_from_pdf_simple_text(self):
         """Test PDF text extraction with simple text"""
         simple_text = "This is a simple test document for PDF extraction."
-        pdf_bytes = self._create_sample_pdf_bytes(simple_text)
+        pdf_bytes = _create_sample_pdf_bytes(_split_lines(simple_text))
         
         result = self.file_parser.extract_text_from_pdf(pdf_bytes)
         
@@ -160,7 +179,7 @@ PROJECTS
     def test_extract_text_from_docx_simple_text(self):
         """Test DOCX text extraction with simple text"""
         simple_text = "This is a simple test document for DOCX extraction."
-        docx_bytes = self._create_sample_docx_bytes(simple_text)
+        docx_bytes = _create_sample_docx_bytes(_split_lines(simple_text))
         
         result = self.file_parser.extract_text_from_docx(docx_bytes)
         
@@ -174,13 +193,13 @@ PROJECTS
 Second paragraph with different content.
 Third paragraph to test multiple paragraphs."""
         
-        pdf_bytes = self._create_sample_pdf_bytes(multi_para_text)
+        pdf_bytes = _create_sample_pdf_bytes(_split_lines(multi_para_text))
         result = self.file_parser.extract_text_from_pdf(pdf_bytes)
         
         assert isinstance(result, str)
         assert len(result) > 0
         # Check that we get some content back
-        assert any(word in result.lower() for word in ["first", "second", "third", "paragraph"])
+        assert self._PARA_RE.search(result)
     
     def test_extract_text_from_docx_multiple_paragraphs(self):
         """Test DOCX text extraction with multiple paragraphs"""
@@ -188,7 +207,7 @@ Third paragraph to test multiple paragraphs."""
 Second paragraph with different content.
 Third paragraph to test multiple paragraphs."""
         
-        docx_bytes = self._create_sample_docx_bytes(multi_para_text)
+        docx_bytes = _create_sample_docx_bytes(_split_lines(multi_para_text))
         result = self.file_parser.extract_text_from_docx(docx_bytes)
         
         assert isinstance(result, str)
@@ -200,7 +219,7 @@ Third paragraph to test multiple paragraphs."""
     def test_extract_text_from_pdf_special_characters(self):
         """Test PDF text extraction with special characters"""
         special_text = "Special chars: éñüß@#$%^&*()_+-=[]{}|;':\",./<>?"
-        pdf_bytes = self._create_sample_pdf_bytes(special_text)
+        pdf_bytes = _create_sample_pdf_bytes(_split_lines(special_text))
         
         result = self.file_parser.extract_text_from_pdf(pdf_bytes)
         
@@ -212,7 +231,7 @@ Third paragraph to test multiple paragraphs."""
     def test_extract_text_from_docx_special_characters(self):
         """Test DOCX text extraction with special characters"""
         special_text = "Special chars: éñüß@#$%^&*()_+-=[]{}|;':\",./<>?"
-        docx_bytes = self._create_sample_docx_bytes(special_text)
+        docx_bytes = _create_sample_docx_bytes(_split_lines(special_text))
         
         result = self.file_parser.extract_text_from_docx(docx_bytes)
         
@@ -225,7 +244,7 @@ Third paragraph to test multiple paragraphs."""
     def test_extract_text_from_pdf_empty_content(self):
         """Test PDF text extraction with empty content"""
         empty_text = ""
-        pdf_bytes = self._create_sample_pdf_bytes(empty_text)
+        pdf_bytes = _create_sample_pdf_bytes(_split_lines(empty_text))
         
         result = self.file_parser.extract_text_from_pdf(pdf_bytes)
         
@@ -236,7 +255,7 @@ Third paragraph to test multiple paragraphs."""
     def test_extract_text_from_docx_empty_content(self):
         """Test DOCX text extraction with empty content"""
         empty_text = ""
-        docx_bytes = self._create_sample_docx_bytes(empty_text)
+        docx_bytes = _create_sample_docx_bytes(_split_lines(empty_text))
         
         result = self.file_parser.extract_text_from_docx(docx_bytes)
         
@@ -247,7 +266,7 @@ Third paragraph to test multiple paragraphs."""
     def test_extract_text_from_pdf_large_content(self):
         """Test PDF text extraction with large content"""
         large_text = "Large content test. " * 1000  # Create large text
-        pdf_bytes = self._create_sample_pdf_bytes(large_text)
+        pdf_bytes = _create_sample_pdf_bytes(_split_lines(large_text))
         
         result = self.file_parser.extract_text_from_pdf(pdf_bytes)
         
@@ -259,7 +278,7 @@ Third paragraph to test multiple paragraphs."""
     def test_extract_text_from_docx_large_content(self):
         """Test DOCX text extraction with large content"""
         large_text = "Large content test. " * 1000  # Create large text
-        docx_bytes = self._create_sample_docx_bytes(large_text)
+        docx_bytes = _create_sample_docx_bytes(_split_lines(large_text))
         
         result = self.file_parser.extract_text_from_docx(docx_bytes)
         
@@ -268,6 +287,237 @@ Third paragraph to test multiple paragraphs."""
         assert "Large content test" in result
         assert len(result) > 1000  # Should contain substantial content
     
+    def test_extract_text_from_pdf_bytearray(self):
+        """Test PDF text extraction from a bytearray upload buffer"""
+        pdf_bytes = _create_sample_pdf_bytes(self.sample_resume_lines)
+        
+        result = self.file_parser.extract_text_from_pdf(bytearray(pdf_bytes))
+        
+        assert result == self.file_parser.extract_text_from_pdf(pdf_bytes)
+    
+    def test_extract_text_from_docx_bytearray(self):
+        """Test DOCX text extraction from a bytearray upload buffer"""
+        docx_bytes = _create_sample_docx_bytes(self.sample_resume_lines)
+        
+        result = self.file_parser.extract_text_from_docx(bytearray(docx_bytes))
+        
+        assert result == self.file_parser.extract_text_from_docx(docx_bytes)
+    
+    def test_extract_text_from_pdf_parallel_pages(self):
+        """Test PDF text extraction of a long document across worker processes"""
+        long_text = "\n".join(f"Page line {i}" for i in range(1500))
+        pdf_bytes = _create_sample_pdf_bytes(_split_lines(long_text))
+        
+        with ProcessPoolExecutor(max_workers=2, mp_context=FORKSERVER) as executor:
+            result = FileParserAdapter(executor).extract_text_from_pdf(pdf_bytes)
+        
+        assert result == self.file_parser.extract_text_from_pdf(pdf_bytes)
+        assert result.index("Page line 0") < result.index("Page line 1499")
+    
+    def test_parallel_pages_are_split_into_one_range_per_worker(self):
+        """Test that a long PDF is split by the pool size, not MAX_PAGE_WORKERS"""
+        long_text = "\n".join(f"Page line {i}" for i in range(1500))
+        pdf_bytes = _create_sample_pdf_bytes(_split_lines(long_text))
+        
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            executor = MagicMock(wraps=pool, _max_workers=3)
+            result = FileParserAdapter(executor).extract_text_from_pdf(pdf_bytes)
+        
+        assert result == self.file_parser.extract_text_from_pdf(pdf_bytes)
+        _, files, starts, stops = executor.map.call_args.args
+        assert len(files) == len(starts) == len(stops) == 3
+    
+    def test_single_worker_pool_is_not_used(self):
+        """Test that a one-process pool leaves parsing in this process"""
+        long_text = "\n".join(f"Page line {i}" for i in range(1500))
+        pdf_bytes = _create_sample_pdf_bytes(_split_lines(long_text))
+        executor = MagicMock(spec=Executor, _max_workers=1)
+        parser = FileParserAdapter(executor)
+        
+        result = parser.extract_text_from_pdf(pdf_bytes)
+        other_pdf = _create_sample_pdf_bytes(("Other",))
+        batch = parser.extract_text_batch([pdf_bytes, other_pdf])
+        
+        assert result == self.file_parser.extract_text_from_pdf(pdf_bytes)
+        assert batch == [result, "Other"]
+        executor.map.assert_not_called()
+        executor.submit.assert_not_called()
+    
+    def test_short_pdf_is_parsed_in_the_pool(self):
+        """Test that PDFs below the page threshold are also handed to the pool"""
+        pdf_bytes = _create_sample_pdf_bytes(self.sample_resume_lines)
+        
+        with ProcessPoolExecutor(max_workers=2, mp_context=FORKSERVER) as pool:
+            executor = MagicMock(wraps=pool, _max_workers=2)
+            result = FileParserAdapter(executor).extract_text_from_pdf(pdf_bytes)
+        
+        assert result == self.file_parser.extract_text_from_pdf(pdf_bytes)
+        executor.submit.assert_called_once()
+        executor.map.assert_not_called()
+    
+    def test_extract_text_from_pdf_bytes_is_utf8_text(self):
+        """Test the bytes variant of PDF text extraction"""
+        pdf_bytes = _create_sample_pdf_bytes(self.sample_resume_lines)
+        
+        result = self.file_parser.extract_text_from_pdf_bytes(pdf_bytes)
+        
+        assert isinstance(result, bytes)
+        assert result.decode("utf-8") == self.file_parser.extract_text_from_pdf(pdf_bytes)
+    
+    def test_extract_text_from_pdf_concurrently_from_threads(self):
+        """Test that PDFs parsed on many threads at once match sequential parsing"""
+        pdf_files = [
+            _create_sample_pdf_bytes(_split_lines(
+                "\n".join(f"Resume {index} line {i}" for i in range(60 * index + 10))
+            ))
+            for index in range(4)
+        ]
+        expected = [self.file_parser.extract_text_from_pdf(pdf) for pdf in pdf_files]
+        
+        # No parse cache, so every call really goes through the PDF library
+        parser = FileParserAdapter(cache_size=0)
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(parser.extract_text_from_pdf, pdf_files * 16))
+        
+        assert results == expected * 16
+    
+    def test_paused_page_iterator_does_not_block_other_threads(self):
+        """Test that the PDF library lock is not held between yielded pages"""
+        long_text = "\n".join(f"Page line {i}" for i in range(100))
+        pages = self.file_parser.iter_pdf_pages(_create_sample_pdf_bytes(_split_lines(long_text)))
+        next(pages)
+        pdf_bytes = _create_sample_pdf_bytes(self.sample_resume_lines)
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            result = executor.submit(
+                FileParserAdapter(cache_size=0).extract_text_from_pdf, pdf_bytes
+            ).result(timeout=30)
+        
+        assert "JOHN DOE" in result
+        assert "Page line 99" in "".join(pages)
+    
+    def test_extract_text_from_pdf_skips_blank_pages(self):
+        """Test that pages without text add no empty lines to the text"""
+        from reportlab.pdfgen import canvas
+        
+        # Enough pages for the parallel path, every other one blank
+        buffer = BytesIO()
+        c = canvas.Canvas(buffer)
+        for page_number in range(24):
+            if page_number % 2 == 0:
+                c.drawString(50, 700, f"Page {page_number}")
+            c.showPage()
+        c.save()
+        pdf_bytes = buffer.getvalue()
+        expected = "\n".join(f"Page {page_number}" for page_number in range(0, 24, 2))
+        
+        with ProcessPoolExecutor(max_workers=2, mp_context=FORKSERVER) as executor:
+            parallel = FileParserAdapter(executor).extract_text_from_pdf(pdf_bytes)
+        
+        assert self.file_parser.extract_text_from_pdf(pdf_bytes) == expected
+        assert parallel == expected
+        pages = list(self.file_parser.iter_pdf_pages(pdf_bytes))
+        assert len(pages) == 24
+        assert pages[:3] == ["Page 0", "", "Page 2"]
+    
+    def test_iter_pdf_pages_yields_each_page_lazily(self):
+        """Test that PDF pages are streamed one at a time in order"""
+        long_text = "\n".join(f"Page line {i}" for i in range(100))
+        pdf_bytes = _create_sample_pdf_bytes(_split_lines(long_text))
+        
+        pages = self.file_parser.iter_pdf_pages(pdf_bytes)
+        first_page = next(pages)
+        
+        assert "Page line 0" in first_page
+        assert "Page line 99" not in first_page
+        assert ("\n".join([first_page, *pages]).strip()
+                == self.file_parser.extract_text_from_pdf(pdf_bytes))
+    
+    def test_extract_text_from_binary_streams(self):
+        """Test PDF and DOCX text extraction from file-like objects"""
+        pdf_bytes = _create_sample_pdf_bytes(self.sample_resume_lines)
+        docx_bytes = _create_sample_docx_bytes(self.sample_resume_lines)
+        
+        assert (FileParserAdapter().extract_text_from_pdf(BytesIO(pdf_bytes))
+                == self.file_parser.extract_text_from_pdf(pdf_bytes))
+        assert (FileParserAdapter().extract_text_from_docx(BytesIO(docx_bytes))
+                == self.file_parser.extract_text_from_docx(docx_bytes))
+    
+    def test_extract_text_reuses_cached_text_for_identical_files(self):
+        """Test that identical file content is parsed once and served from cache"""
+        pdf_bytes = _create_sample_pdf_bytes(self.sample_resume_lines)
+        docx_bytes = _create_sample_docx_bytes(self.sample_resume_lines)
+        
+        pdf_text = self.file_parser.extract_text_from_pdf(pdf_bytes)
+        docx_text = self.file_parser.extract_text_from_docx(docx_bytes)
+        
+        assert self.file_parser.extract_text_from_pdf(bytes(pdf_bytes)) is pdf_text
+        assert self.file_parser.extract_text_from_docx(bytes(docx_bytes)) is docx_text
+    
+    def test_redis_outage_falls_back_to_local_parsing(self):
+        """Test that redis errors are logged and never fail the parse"""
+        redis_client = MagicMock()
+        redis_client.get.side_effect = ConnectionError("redis unavailable")
+        redis_client.setex.side_effect = TimeoutError("redis timed out")
+        parser = FileParserAdapter(redis_client=redis_client)
+        pdf_bytes = _create_sample_pdf_bytes(self.sample_resume_lines)
+        
+        first = parser.extract_text_from_pdf(pdf_bytes)
+        second = parser.extract_text_from_pdf(pdf_bytes)
+        
+        assert first == self.file_parser.extract_text_from_pdf(pdf_bytes)
+        assert second is first  # served from the local LRU
+        assert redis_client.get.call_count == 1
+        redis_client.setex.assert_called_once()
+    
+    def test_redis_hit_skips_parsing(self):
+        """Test that text cached in redis by another worker is reused"""
+        redis_client = MagicMock()
+        redis_client.get.return_value = b"Cached resume text"
+        parser = FileParserAdapter(redis_client=redis_client)
+        
+        assert parser.extract_text_from_pdf(b"not parsed") == "Cached resume text"
+        redis_client.setex.assert_not_called()
+    
+    def test_extract_text_batch_matches_single_extraction(self):
+        """Test batch extraction across worker processes keeps input order"""
+        pdf_files = [
+            _create_sample_pdf_bytes(_split_lines(text))
+            for text in ("First resume", "Second resume", "First resume", "Third resume")
+        ]
+        
+        with ProcessPoolExecutor(max_workers=2, mp_context=FORKSERVER) as executor:
+            result = FileParserAdapter(executor).extract_text_batch(pdf_files, kind="pdf")
+        
+        assert result == [self.file_parser.extract_text_from_pdf(f) for f in pdf_files]
+        assert "First resume" in result[0]
+        assert "Second resume" in result[1]
+    
+    def test_extract_text_batch_without_executor_parses_in_process(self):
+        """Test batch extraction when no worker pool is configured"""
+        docx_files = [
+            _create_sample_docx_bytes(_split_lines(text))
+            for text in ("First resume", "Second resume")
+        ]
+        
+        result = self.file_parser.extract_text_batch(docx_files, kind="docx")
+        
+        assert result == ["First resume", "Second resume"]
+    
+    def test_read_batch_returns_file_bytes_in_order(self, tmp_path):
+        """Test reading several resume files from disk at once"""
+        paths = []
+        for index, text in enumerate(("First resume", "Second resume", "Third resume")):
+            path = tmp_path / f"resume_{index}.pdf"
+            path.write_bytes(_create_sample_pdf_bytes(_split_lines(text)))
+            paths.append(path)
+        
+        result = self.file_parser.read_batch(paths, workers=2)
+        
+        assert result == [path.read_bytes() for path in paths]
+        texts = self.file_parser.extract_text_batch(result, kind="pdf")
+        assert "Second resume" in texts[1]
+    
     def test_file_parser_implements_port_interface(self):
         """Test that FileParserAdapter implements the FileParserPort interface"""
         # Check that the class has the required methods
@@ -0,0 +1,39 @@
+"""
+Tests for KeywordMatcher
+"""
+
+from src.adapters.keyword_matcher import KeywordMatcher
+
+
+class TestKeywordMatcher:
+    """Test cases for KeywordMatcher"""
+    
+    def setup_method(self):
+        """Set up a matcher over a small keyword dictionary"""
+        self.matcher = KeywordMatcher(("React", "Node.js", "Python", "CI/CD", "AWS"))
+    
+    def test_find_is_case_insensitive(self):
+        """Test that keywords match regardless of case, returned as listed"""
+        result = self.matcher.find("Built services in PYTHON and react, deployed on aws")
+        
+        assert result == ["React", "Python", "AWS"]
+    
+    def test_find_returns_keywords_in_dictionary_order(self):
+        """Test that results follow the keyword list, not the text"""
+        result = self.matcher.find("CI/CD pipelines, then Node.js, then React")
+        
+        assert result == ["React", "Node.js", "CI/CD"]
+    
+    def test_find_reports_repeated_keywords_once(self):
+        """Test that several occurrences of a keyword give one result"""
+        result = self.matcher.find("Python, python and more Python; React and React")
+        
+        assert result == ["React", "Python"]
+    
+    def test_find_without_matches(self):
+        """Test text containing none of the keywords"""
+        assert self.matcher.find("Accountant with ten years of audit experience") == []
+    
+    def test_empty_dictionary_matches_nothing(self):
+        """Test a matcher built from no keywords"""
+        assert KeywordMatcher(()).find("Python and React") == []
@@ -0,0 +1,317 @@
+"""
+Tests for OpenAIAnalysisAdapter
+"""
+
+import asyncio
+import re
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+import httpx
+import openai
+import orjson
+import pytest
+from src.adapters.openai_analysis_adapter import (
+    ANALYSIS_MODEL, ATS_SYSTEM_PROMPT, BATCH_API_THRESHOLD, BULK_ATS_SYSTEM_PROMPT,
+    OpenAIAnalysisAdapter
+)
+from src.domain.resume import AnalysisMode
+
+
+def _batch_output_line(custom_id: str, status_code: int, analysis: dict) -> bytes:
+    """One line of a Batch API output file"""
+    return orjson.dumps({
+        "custom_id": custom_id,
+        "response": {
+            "status_code": status_code,
+            "body": {"choices": [{"message": {"content": orjson.dumps(analysis).decode()}}]}
+        }
+    })
+
+
+def _mock_client() -> MagicMock:
+    """AsyncOpenAI stand-in with the file and batch endpoints the adapter uses"""
+    client = MagicMock()
+    client.files.create = AsyncMock(return_value=SimpleNamespace(id="file-input"))
+    client.batches.create = AsyncMock(return_value=SimpleNamespace(id="batch-1"))
+    client.batches.retrieve = AsyncMock(return_value=SimpleNamespace(
+        status="completed", output_file_id="file-output"
+    ))
+    client.files.content = AsyncMock()
+    return client
+
+
+def _bulk_reply(system_prompt: str, prompt: str) -> dict:
+    """Bulk pre-screen reply scoring each numbered resume by its number"""
+    if system_prompt != BULK_ATS_SYSTEM_PROMPT:
+        return {"score": 0}
+    indexes = [int(index) for index in re.findall(r"^Resume (\d+):$", prompt, re.M)]
+    return {"results": [
+        {"index": index, "score": index} for index in reversed(indexes)
+    ]}
+
+
+def _context_length_exceeded() -> openai.BadRequestError:
+    """The error OpenAI returns for a prompt over the model context"""
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    return openai.BadRequestError(
+        "maximum context length exceeded",
+        response=httpx.Response(400, request=request),
+        body={"code": "context_length_exceeded"}
+    )
+
+
+class FakeStream:
+    """Async iterator standing in for a streamed chat completion"""
+    
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self):
+        try:
+            return next(self._chunks)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def _chunk(content):
+    """A streamed chunk whose single choice carries this delta content"""
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+class TestOpenAIAnalysisAdapterStreaming:
+    """Test cases for streamed chat completions"""
+    
+    def setup_method(self):
+        """Set up an adapter with a mocked OpenAI client"""
+        self.adapter = OpenAIAnalysisAdapter(api_key="test-key")
+        self.adapter.client = _mock_client()
+    
+    def test_complete_assembles_streamed_json(self):
+        """Test that delta contents are joined in order and parsed once"""
+        self.adapter.client.chat.completions.create = AsyncMock(return_value=FakeStream([
+            _chunk(""),  # role-only first chunk
+            _chunk('{"score": 8, '),
+            _chunk(None),
+            _chunk('"strengths": ["Clear'),
+            _chunk(' layout"]}'),
+            _chunk(None),  # finish_reason chunk
+            SimpleNamespace(choices=[])  # trailing usage chunk
+        ]))
+        
+        result = asyncio.run(self.adapter._complete(ATS_SYSTEM_PROMPT, "Resume Text:\nJane"))
+        
+        assert result == {"score": 8, "strengths": ["Clear layout"]}
+        kwargs = self.adapter.client.chat.completions.create.await_args.kwargs
+        assert kwargs["stream"] is True
+        assert kwargs["model"] == ANALYSIS_MODEL
+        assert kwargs["response_format"] == {"type": "json_object"}
+    
+    def test_analyze_resume_content_uses_the_stream(self):
+        """Test a cached single analysis over a streamed completion"""
+        self.adapter.client.chat.completions.create = AsyncMock(
+            side_effect=lambda **kwargs: FakeStream([_chunk('{"score": 6}')])
+        )
+        
+        first = asyncio.run(self.adapter.analyze_resume_content("Jane", AnalysisMode.ATS))
+        second = asyncio.run(self.adapter.analyze_resume_content("Jane", AnalysisMode.ATS))
+        
+        assert first == second == {"score": 6}
+        assert self.adapter.client.chat.completions.create.await_count == 1
+
+
+class TestOpenAIAnalysisAdapterBatch:
+    """Test cases for the OpenAI Batch API path"""
+    
+    def setup_method(self):
+        """Set up an adapter with a mocked OpenAI client"""
+        self.adapter = OpenAIAnalysisAdapter(api_key="test-key")
+        self.adapter.client = _mock_client()
+    
+    def test_small_batches_use_online_requests(self):
+        """Test that job match batches below the threshold skip the Batch API"""
+        self.adapter._complete = AsyncMock(return_value={"score": 7})
+        resume_texts = {"a": "First resume", "b": "Second resume"}
+        
+        results = asyncio.run(self.adapter.analyze_resume_content_batch(
+            resume_texts, AnalysisMode.JOB_MATCH, "Backend engineer"
+        ))
+        
+        assert results == {"a": {"score": 7}, "b": {"score": 7}}
+        assert self.adapter._complete.await_count == 2
+        self.adapter.client.batches.create.assert_not_called()
+    
+    def test_submit_batch_uploads_one_chat_request_per_resume(self):
+        """Test the JSONL batch file built for a set of resumes"""
+        resume_texts = {"resume-1": "First resume", "resume-2": "Second resume"}
+        
+        batch_id = asyncio.run(self.adapter.submit_batch(resume_texts, AnalysisMode.ATS))
+        
+        assert batch_id == "batch-1"
+        file_name, content = self.adapter.client.files.create.await_args.kwargs["file"]
+        assert file_name.endswith(".jsonl")
+        requests = [orjson.loads(line) for line in content.splitlines()]
+        assert [request["custom_id"] for request in requests] == ["resume-1", "resume-2"]
+        for request, resume_text in zip(requests, resume_texts.values()):
+            assert request["method"] == "POST"
+            assert request["url"] == "/v1/chat/completions"
+            assert request["body"]["model"] == ANALYSIS_MODEL
+            assert request["body"]["messages"][0] == {
+                "role": "system", "content": ATS_SYSTEM_PROMPT
+            }
+            assert resume_text in request["body"]["messages"][1]["content"]
+        self.adapter.client.batches.create.assert_awaited_once_with(
+            input_file_id="file-input",
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+    
+    def test_poll_batch_waits_for_a_terminal_status(self):
+        """Test that polling stops at the first terminal batch status"""
+        self.adapter.client.batches.retrieve = AsyncMock(side_effect=[
+            SimpleNamespace(status="validating"),
+            SimpleNamespace(status="in_progress"),
+            SimpleNamespace(status="completed", output_file_id="file-output")
+        ])
+        
+        batch = asyncio.run(self.adapter.poll_batch("batch-1", poll_interval=0))
+        
+        assert batch.status == "completed"
+        assert self.adapter.client.batches.retrieve.await_count == 3
+    
+    def test_fetch_results_drops_failed_lines(self):
+        """Test that only successful batch responses are returned"""
+        self.adapter.client.files.content.return_value = SimpleNamespace(content=b"\n".join((
+            _batch_output_line("ok", 200, {"score": 8}),
+            _batch_output_line("rate-limited", 429, {"score": 1}),
+            orjson.dumps({"custom_id": "errored", "response": None,
+                          "error": {"code": "server_error"}}),
+            b"",
+            _batch_output_line("also-ok", 200, {"score": 6})
+        )))
+        
+        results = asyncio.run(self.adapter.fetch_results("file-output"))
+        
+        assert results == {"ok": {"score": 8}, "also-ok": {"score": 6}}
+    
+    def test_large_batches_go_through_the_batch_api(self):
+        """Test submit, poll and fetch for a batch at the threshold"""
+        resume_texts = {f"resume-{i}": f"Resume {i}" for i in range(BATCH_API_THRESHOLD)}
+        self.adapter.client.files.content.return_value = SimpleNamespace(content=b"\n".join(
+            _batch_output_line(custom_id, 200 if i else 500, {"score": 5})
+            for i, custom_id in enumerate(resume_texts)
+        ))
+        
+        results = asyncio.run(
+            self.adapter.analyze_resume_content_batch(resume_texts, AnalysisMode.ATS)
+        )
+        
+        assert list(results) == list(resume_texts)[1:]
+        self.adapter.client.files.content.assert_awaited_once_with("file-output")
+    
+    def test_unsuccessful_batch_raises(self):
+        """Test that a batch ending in a non-completed status is an error"""
+        self.adapter.client.batches.retrieve.return_value = SimpleNamespace(
+            status="expired", output_file_id=None
+        )
+        resume_texts = {f"resume-{i}": f"Resume {i}" for i in range(BATCH_API_THRESHOLD)}
+        
+        with pytest.raises(RuntimeError, match="expired"):
+            asyncio.run(
+                self.adapter.analyze_resume_content_batch(resume_texts, AnalysisMode.ATS)
+            )
+
+
+class TestOpenAIAnalysisAdapterBulk:
+    """Test cases for multi-resume ATS pre-screening"""
+    
+    def setup_method(self):
+        """Set up an adapter whose completions answer bulk prompts"""
+        self.adapter = OpenAIAnalysisAdapter(api_key="test-key")
+        self.adapter.client = _mock_client()
+        self.adapter._complete = AsyncMock(side_effect=_bulk_reply)
+    
+    def test_small_ats_batches_share_one_prompt(self):
+        """Test that several resumes go out numbered in a single request"""
+        resume_texts = {"a": "First resume", "b": "Second resume", "c": "Third resume"}
+        
+        results = asyncio.run(
+            self.adapter.analyze_resume_content_batch(resume_texts, AnalysisMode.ATS)
+        )
+        
+        assert results == {"a": {"score": 1}, "b": {"score": 2}, "c": {"score": 3}}
+        system_prompt, prompt = self.adapter._complete.await_args.args
+        assert system_prompt == BULK_ATS_SYSTEM_PROMPT
+        assert prompt == (
+            "Resume 1:\nFirst resume\n\n"
+            "Resume 2:\nSecond resume\n\n"
+            "Resume 3:\nThird resume"
+        )
+        self.adapter.client.batches.create.assert_not_called()
+    
+    def test_bulk_groups_are_capped_at_the_batch_size(self):
+        """Test that resumes are split into groups of at most batch_size"""
+        resume_texts = [f"Resume text {i}" for i in range(7)]
+        
+        results = asyncio.run(
+            self.adapter.analyze_resumes_bulk(resume_texts, batch_size=3)
+        )
+        
+        assert [result["score"] for result in results] == [1, 2, 3, 1, 2, 3, 1]
+        assert self.adapter._complete.await_count == 3
+    
+    def test_resumes_left_out_of_the_reply_are_dropped(self):
+        """Test that only resumes the model answered are returned"""
+        self.adapter._complete = AsyncMock(return_value={"results": [
+            {"index": 2, "score": 6}, {"index": "first", "score": 9}
+        ]})
+        
+        results = asyncio.run(self.adapter.analyze_resume_content_batch(
+            {"a": "First resume", "b": "Second resume"}, AnalysisMode.ATS
+        ))
+        
+        assert results == {"b": {"score": 6}}
+    
+    def test_context_length_exceeded_halves_the_group(self):
+        """Test that an oversized group is retried as two smaller prompts"""
+        async def complete(system_prompt, prompt):
+            if len(re.findall(r"^Resume \d+:$", prompt, re.M)) > 2:
+                raise _context_length_exceeded()
+            return _bulk_reply(system_prompt, prompt)
+        self.adapter._complete = AsyncMock(side_effect=complete)
+        resume_texts = [f"Resume text {i}" for i in range(4)]
+        
+        results = asyncio.run(self.adapter.analyze_resumes_bulk(resume_texts))
+        
+        assert [result["score"] for result in results] == [1, 2, 1, 2]
+        assert self.adapter._complete.await_count == 3
+    
+    def test_context_length_exceeded_for_one_resume_is_raised(self):
+        """Test that a single resume over the context limit is an error"""
+        self.adapter._complete = AsyncMock(side_effect=_context_length_exceeded())
+        
+        with pytest.raises(openai.BadRequestError):
+            asyncio.run(self.adapter.analyze_resumes_bulk(["Very long resume"]))
+    
+    def test_cached_resumes_are_not_prescreened_again(self):
+        """Test that bulk results are cached per resume and reused"""
+        resume_texts = {"a": "First resume", "b": "Second resume"}
+        asyncio.run(
+            self.adapter.analyze_resume_content_batch(resume_texts, AnalysisMode.ATS)
+        )
+        
+        again = asyncio.run(self.adapter.analyze_resume_content_batch(
+            {"c": "Third resume", "b": "Second resume", "a": "First resume"},
+            AnalysisMode.ATS
+        ))
+        single = asyncio.run(
+            self.adapter.analyze_resume_content("First resume", AnalysisMode.ATS)
+        )
+        
+        assert again == {"c": {"score": 0}, "b": {"score": 2}, "a": {"score": 1}}
+        assert list(again) == ["c", "b", "a"]
+        assert single == {"score": 1}
+        assert self.adapter._complete.await_count == 2
+        assert self.adapter._complete.await_args.args[0] == ATS_SYSTEM_PROMPT
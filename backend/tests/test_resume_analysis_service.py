@@ -0,0 +1,198 @@
+"""
+Tests for ResumeAnalysisService
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from unittest.mock import AsyncMock
+from src.adapters.analysis_repository import InMemoryAnalysisRepository
+from src.adapters.file_parser_adapter import FileParserAdapter
+from src.adapters.openai_analysis_adapter import (
+    ATS_SYSTEM_PROMPT, BULK_ATS_SYSTEM_PROMPT, OpenAIAnalysisAdapter
+)
+from src.domain.resume import AnalysisMode, ContactInfo, JobDescription, Resume
+from src.domain.resume_analysis_service import ANALYSIS_REUSE_TTL, ResumeAnalysisService
+from src.ports.resume_analysis_port import AIAnalysisPort
+
+
+class RecordingAIAnalyzer(AIAnalysisPort):
+    """AI analyzer stand-in that records what it was asked to analyze"""
+    
+    def __init__(self):
+        self.single_calls: List[AnalysisMode] = []
+        self.batch_calls: List[List[str]] = []
+        self.combined_calls = 0
+    
+    async def analyze_resume_content(self, resume_text: str, analysis_mode: AnalysisMode,
+                                     job_description: Optional[str] = None) -> dict:
+        self.single_calls.append(analysis_mode)
+        return {"score": 8, "strengths": ["Clear structure"], "recommendations": []}
+    
+    async def analyze_resume_content_combined(self, resume_text: str,
+                                              job_description: str) -> dict:
+        self.combined_calls += 1
+        return {"ats": {"score": 7}, "job_match": {"score": 6}}
+    
+    async def analyze_resume_content_batch(self, resume_texts: Dict[str, str],
+                                           analysis_mode: AnalysisMode,
+                                           job_description: Optional[str] = None
+                                           ) -> Dict[str, dict]:
+        self.batch_calls.append(list(resume_texts))
+        return {resume_id: {"score": 9} for resume_id in resume_texts}
+    
+    def extract_keywords(self, text: str) -> List[str]:
+        return ["Python"]
+
+
+def _resume(resume_id: str, content_hash: Optional[str] = "hash-a",
+            raw_text: str = "Jane Doe\nEXPERIENCE\nPython developer") -> Resume:
+    """A parsed resume with the given content hash"""
+    return Resume(
+        id=resume_id,
+        raw_text=raw_text,
+        contact_info=ContactInfo(email="jane@example.com"),
+        sections=[],
+        keywords=["Python"],
+        created_at=datetime.now(tz=timezone.utc),
+        content_hash=content_hash
+    )
+
+
+JOB_DESCRIPTION = JobDescription(
+    id="job-1",
+    raw_text="Python developer wanted",
+    required_skills=["Python"],
+    preferred_skills=[],
+    keywords=["Python", "GraphQL"]
+)
+
+
+class TestResumeAnalysisService:
+    """Test cases for ResumeAnalysisService"""
+    
+    def setup_method(self):
+        """Set up a service with in-memory collaborators"""
+        self.repository = InMemoryAnalysisRepository()
+        self.ai_analyzer = RecordingAIAnalyzer()
+        self.service = ResumeAnalysisService(
+            FileParserAdapter(), self.ai_analyzer, self.repository
+        )
+    
+    def test_extract_sections_matches_headers_at_line_start(self):
+        """Test that section headers are found at the start of a line"""
+        text = "PROFESSIONAL SUMMARY\nBuilt APIs.\n  Technical Skills\nPython\n\tEducation\nBSc"
+        
+        sections = self.service._extract_sections(text)
+        
+        assert [section.name for section in sections] == ["education", "skills", "summary"]
+    
+    def test_extract_sections_ignores_mentions_mid_line(self):
+        """Test that section words inside body text are not headers"""
+        text = (
+            "EXPERIENCE\n"
+            "Led projects for the education team and ran skills workshops\n"
+            "Maintained a portfolio of certifications tooling"
+        )
+        
+        sections = self.service._extract_sections(text)
+        
+        assert [section.name for section in sections] == ["experience"]
+    
+    def test_identical_resume_reuses_ats_analysis_for_the_new_resume(self):
+        """Test that a reused analysis is re-issued for the resume just uploaded"""
+        first = asyncio.run(self.service.analyze_ats_compatibility(_resume("resume-1")))
+        second = asyncio.run(self.service.analyze_ats_compatibility(_resume("resume-2")))
+        
+        assert self.ai_analyzer.single_calls == [AnalysisMode.ATS]
+        assert second.resume_id == "resume-2"
+        assert second.id != first.id
+        assert (second.score, second.feedback, second.strengths) == (
+            first.score, first.feedback, first.strengths
+        )
+        assert self.repository.get_analysis(second.id) is second
+        assert self.repository.get_analyses_by_resume("resume-2") == [second]
+        assert [a.resume_id for a in self.repository.get_analyses_by_resume("resume-1")] == [
+            "resume-1"
+        ]
+    
+    def test_resume_without_content_hash_is_always_analyzed(self):
+        """Test that reuse needs a content hash"""
+        asyncio.run(self.service.analyze_ats_compatibility(_resume("resume-1", None)))
+        asyncio.run(self.service.analyze_ats_compatibility(_resume("resume-2", None)))
+        
+        assert self.ai_analyzer.single_calls == [AnalysisMode.ATS, AnalysisMode.ATS]
+    
+    def test_expired_analysis_is_not_reused(self):
+        """Test that analyses older than the reuse TTL trigger a new AI call"""
+        stale = asyncio.run(self.service.analyze_ats_compatibility(_resume("resume-1")))
+        stale.created_at -= ANALYSIS_REUSE_TTL + timedelta(minutes=1)
+        
+        fresh = asyncio.run(self.service.analyze_ats_compatibility(_resume("resume-2")))
+        
+        assert len(self.ai_analyzer.single_calls) == 2
+        assert fresh.created_at > stale.created_at
+    
+    def test_ats_batch_only_sends_resumes_without_a_recent_analysis(self):
+        """Test reuse in the batch ATS path"""
+        earlier = asyncio.run(self.service.analyze_ats_compatibility(_resume("resume-1")))
+        
+        results = asyncio.run(self.service.analyze_ats_batch([
+            _resume("resume-2"), _resume("resume-3", content_hash="hash-b")
+        ]))
+        
+        assert self.ai_analyzer.batch_calls == [["resume-3"]]
+        assert [result.resume_id for result in results] == ["resume-2", "resume-3"]
+        assert results[0].score == earlier.score
+        assert results[1].score != earlier.score
+    
+    def test_analyze_both_reuses_ats_and_only_requests_the_job_match(self):
+        """Test reuse in the combined ATS and job match path"""
+        asyncio.run(self.service.analyze_ats_compatibility(_resume("resume-1")))
+        
+        ats, job_match = asyncio.run(
+            self.service.analyze_both(_resume("resume-2"), JOB_DESCRIPTION)
+        )
+        
+        assert self.ai_analyzer.combined_calls == 0
+        assert self.ai_analyzer.single_calls == [AnalysisMode.ATS, AnalysisMode.JOB_MATCH]
+        assert (ats.resume_id, ats.mode) == ("resume-2", AnalysisMode.ATS)
+        assert (job_match.resume_id, job_match.mode) == ("resume-2", AnalysisMode.JOB_MATCH)
+    
+    def test_analyze_both_uses_one_request_without_a_recent_analysis(self):
+        """Test that a new resume still gets a single combined AI request"""
+        ats, job_match = asyncio.run(
+            self.service.analyze_both(_resume("resume-1"), JOB_DESCRIPTION)
+        )
+        
+        assert self.ai_analyzer.combined_calls == 1
+        assert self.ai_analyzer.single_calls == []
+        assert (ats.mode, job_match.mode) == (AnalysisMode.ATS, AnalysisMode.JOB_MATCH)
+    
+    def test_ats_batch_prescreens_resumes_in_one_prompt(self):
+        """Test the batch path over the OpenAI adapter's multi-resume prompt"""
+        async def complete(system_prompt, prompt):
+            if system_prompt == BULK_ATS_SYSTEM_PROMPT:
+                # The reply leaves out the second resume
+                return {"results": [{"index": 3, "score": 9}, {"index": 1, "score": 9}]}
+            return {"score": 4}
+        ai_analyzer = OpenAIAnalysisAdapter(api_key="test-key")
+        ai_analyzer._complete = AsyncMock(side_effect=complete)
+        service = ResumeAnalysisService(
+            FileParserAdapter(), ai_analyzer, self.repository
+        )
+        resumes = [
+            _resume(f"resume-{i}", content_hash=None, raw_text=f"Candidate {i}\nPython")
+            for i in range(1, 4)
+        ]
+        
+        results = asyncio.run(service.analyze_ats_batch(resumes))
+        
+        assert [result.resume_id for result in results] == [
+            "resume-1", "resume-2", "resume-3"
+        ]
+        prompts = [call.args for call in ai_analyzer._complete.await_args_list]
+        assert [system_prompt for system_prompt, _ in prompts] == [
+            BULK_ATS_SYSTEM_PROMPT, ATS_SYSTEM_PROMPT
+        ]
+        assert "Candidate 2" in prompts[1][1]